@@ -4,6 +4,7 @@
 # github_api.py - GitHub API interface for build_iso.py
 #
 
+import functools
 import os
 import time
 from datetime import datetime
@@ -13,6 +14,28 @@ from config import TOKEN_FILE
 from translation_utils import _
 
 
+@functools.lru_cache(maxsize=1)
+def _load_tokens(path: str, mtime: float) -> dict:
+    """Parse the token file into {org.lower(): token}.
+
+    Bare tokens (no ``org=`` prefix) are stored under ``"_default"``; the first
+    one wins. *mtime* is only part of the cache key, so editing the file
+    invalidates the cached result.
+    """
+    tokens = {}
+    with open(path, 'r') as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            if '=' in line:
+                org, token = line.split('=', 1)
+                tokens.setdefault(org.lower(), token)
+            else:
+                tokens.setdefault("_default", line)
+    return tokens
+
+
 class GitHubAPI:
     """Interface with GitHub API for ISO building"""
     
@@ -33,19 +56,13 @@ class GitHubAPI:
             return ""
         
         try:
-            with open(token_file, 'r') as f:
-                token_lines = f.readlines()
+            tokens = _load_tokens(token_file, os.path.getmtime(token_file))
             
-            # Look for token associated with current organization
-            for line in token_lines:
-                line = line.strip()
-                if '=' in line:
-                    org, token = line.split('=', 1)
-                    if org.lower() == self.organization.lower():
-                        return token
-                elif line and '=' not in line:
-                    # If it's just a token without a specific organization
-                    return line
+            # Look for token associated with current organization, falling back
+            # to a token without a specific organization
+            token = tokens.get(self.organization.lower(), tokens.get("_default", ""))
+            if token:
+                return token
             
             logger.die("red", _("Token for organization '{0}' not found.").format(self.organization))
             return ""
@@ -25,6 +25,54 @@ class GitHubAPI:
         self.headers = (
             {"Accept": "application/vnd.github.v3+json", "Authorization": f"token {self.token}"} if token else {}
         )
+        # Conditional request caches for list endpoints: url -> ETag / parsed body
+        self._etag_cache = {}
+        self._body_cache = {}
+
+    @property
+    def organization(self) -> str:
+        return self._organization
+
+    @organization.setter
+    def organization(self, value: str):
+        self._organization = value
+        self._org_lower = (value or "").lower()  # For case-insensitive matches
+
+    def is_organization(self, name: str) -> bool:
+        """Return True if *name* is this API's organization, ignoring case."""
+        return self._org_lower == name.lower()
+
+    def set_token(self, token: str):
+        """Switch to *token*, updating the existing headers dict in place."""
+        self.token = token
+        self.headers["Accept"] = "application/vnd.github.v3+json"
+        self.headers["Authorization"] = f"token {token}"
+
+    def _get_json_cached(self, url: str):
+        """GET *url* with If-None-Match, reusing the cached body on 304.
+
+        Returns a ``(status_code, data)`` tuple. A 304 Not Modified reply is
+        reported as 200 with the body cached from the previous response, and
+        does not count against the rate limit. ``data`` is None on errors.
+        """
+        headers = dict(self.headers)
+        etag = self._etag_cache.get(url)
+        if etag:
+            headers["If-None-Match"] = etag
+
+        response = requests.get(url, headers=headers, timeout=30)
+
+        if response.status_code == 304 and url in self._body_cache:
+            return 200, self._body_cache[url]
+        if response.status_code != 200:
+            return response.status_code, None
+
+        data = response.json()
+        etag = response.headers.get("ETag")
+        if etag:
+            self._etag_cache[url] = etag
+            self._body_cache[url] = data
+        return 200, data
 
     def create_reference(self, branch_type: str, logger) -> str:
         """Creates a reference (tag) in GitHub without creating a local branch"""
@@ -682,11 +730,7 @@ class GitHubAPI:
         # Try to read existing token
         token = self.get_github_token_optional()
         if token:
-            self.token = token
-            self.headers = {
-                "Accept": "application/vnd.github.v3+json",
-                "Authorization": f"token {self.token}"
-            }
+            self.set_token(token)
             return True
         
         # Token not found - guide user through setup
@@ -722,8 +766,7 @@ class GitHubAPI:
                 logger.log("green", _("✓ File permissions set to 600 (owner read/write only)"))
 
             # Update instance
-            self.token = token_input
-            self.headers = {"Accept": "application/vnd.github.v3+json", "Authorization": f"token {self.token}"}
+            self.set_token(token_input)
             return True
 
         except (EOFError, KeyboardInterrupt):
@@ -742,17 +785,14 @@ class GitHubAPI:
             logger.log("cyan", _("Cleaning Actions jobs with '{0}' status...").format(status))
             
             # Fetch workflows runs
-            response = requests.get(
-                f"https://api.github.com/repos/{repo_name}/actions/runs?status={status}",
-                headers=self.headers,
-                timeout=30,
+            status_code, data = self._get_json_cached(
+                f"https://api.github.com/repos/{repo_name}/actions/runs?status={status}"
             )
             
-            if response.status_code != 200:
-                logger.log("red", _("Error fetching Actions jobs. Code: {0}").format(response.status_code))
+            if status_code != 200:
+                logger.log("red", _("Error fetching Actions jobs. Code: {0}").format(status_code))
                 return False
                 
-            data = response.json()
             workflow_runs = data.get('workflow_runs', [])
             
             if not workflow_runs:
@@ -780,6 +820,52 @@ class GitHubAPI:
             logger.log("red", _("Error cleaning Actions jobs: {0}").format(e))
             return False
             
+    def _gql(self, query: str, variables: dict):
+        """Run a GitHub GraphQL query. Returns the ``data`` dict or None on failure."""
+        if not self.token:
+            return None
+        response = requests.post(
+            "https://api.github.com/graphql",
+            json={"query": query, "variables": variables},
+            headers=self.headers,
+            timeout=30,
+        )
+        if response.status_code != 200:
+            return None
+        payload = response.json()
+        if payload.get("errors"):
+            return None
+        return payload.get("data")
+
+    _TAGS_QUERY = """
+        query($owner: String!, $name: String!, $cursor: String) {
+          repository(owner: $owner, name: $name) {
+            refs(refPrefix: "refs/tags/", first: 100, after: $cursor) {
+              nodes { name }
+              pageInfo { hasNextPage endCursor }
+            }
+          }
+        }
+    """
+
+    def _list_tag_names_graphql(self, repo_name: str):
+        """List every tag name of *repo_name* via GraphQL, 100 per request.
+
+        Returns None if the query fails so callers can fall back to REST.
+        """
+        owner, _sep, name = repo_name.partition('/')
+        names = []
+        cursor = None
+        while True:
+            data = self._gql(self._TAGS_QUERY, {"owner": owner, "name": name, "cursor": cursor})
+            if not data or not data.get("repository"):
+                return None
+            refs = data["repository"]["refs"]
+            names.extend(node["name"] for node in refs["nodes"])
+            if not refs["pageInfo"]["hasNextPage"]:
+                return names
+            cursor = refs["pageInfo"]["endCursor"]
+
     def clean_all_tags(self, logger) -> bool:
         """Deletes all tags in the remote repository"""
         try:
@@ -790,23 +876,24 @@ class GitHubAPI:
                 
             logger.log("cyan", _("Getting tag list..."))
             
-            # Fetch tags
-            response = requests.get(f"https://api.github.com/repos/{repo_name}/tags", headers=self.headers, timeout=30)
-            
-            if response.status_code != 200:
-                logger.log("red", _("Error fetching tags. Code: {0}").format(response.status_code))
-                return False
+            # Fetch all tag names in one paginated GraphQL query, falling back
+            # to the REST list endpoint (e.g. when no token is configured)
+            tag_names = self._list_tag_names_graphql(repo_name)
+            if tag_names is None:
+                status_code, tags = self._get_json_cached(f"https://api.github.com/repos/{repo_name}/tags")
                 
-            tags = response.json()
+                if status_code != 200:
+                    logger.log("red", _("Error fetching tags. Code: {0}").format(status_code))
+                    return False
+                tag_names = [tag.get('name') for tag in tags]
             
-            if not tags:
+            if not tag_names:
                 logger.log("yellow", _("No tags found."))
                 return True
                 
             # Delete each tag
             deleted_count = 0
-            for tag in tags:
-                tag_name = tag.get('name')
+            for tag_name in tag_names:
                 logger.log("yellow", _("Deleting tag {0}...").format(tag_name))
                 
                 # To delete a tag, we need to delete the corresponding reference
@@ -887,7 +974,19 @@ class GitHubAPI:
             url = f"https://api.github.com/repos/{repo_name}/pulls"
             response = requests.post(url, json=pr_data, headers=self.headers, timeout=30)
             
+            # Parse the body once; HTML error pages (rate limit, 5xx) are not JSON
+            try:
+                payload = response.json() if response.text else {}
+            except ValueError:
+                payload = {}
+            if not isinstance(payload, dict):
+                payload = {}
+            
             if response.status_code not in [200, 201]:
+                error_msg = payload.get('message', '') or _('Unknown error')
+                if not payload and response.text:
+                    error_msg = f"HTTP {response.status_code}: {response.text[:200]}"
+                
                 # Handle 422 Validation Failed - may be duplicate PR
                 if response.status_code == 422:
                     existing_pr = self._find_existing_pr(repo_name, source_branch, target_branch)
@@ -898,19 +997,17 @@ class GitHubAPI:
                             logger.log("yellow", _("Using existing PR #{0}").format(pr_number))
                     else:
                         if logger:
-                            error_msg = response.json().get('message', '') if response.text else _('Unknown error')
-                            errors = response.json().get('errors', []) if response.text else []
+                            errors = payload.get('errors', [])
                             error_detail = errors[0].get('message', '') if errors else ''
                             full_error = f"{error_msg}: {error_detail}" if error_detail else error_msg
                             logger.log("red", _("Failed to create PR: {0}").format(full_error))
                         return {}
                 else:
                     if logger:
-                        error_msg = response.json().get('message', '') if response.text else _('Unknown error')
                         logger.log("red", _("Failed to create PR: {0}").format(error_msg))
                     return {}
             else:
-                pr_info = response.json()
+                pr_info = payload
                 pr_number = pr_info.get("number", 0)
             
             pr_url = pr_info.get("html_url", "")
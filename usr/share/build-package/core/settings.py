@@ -7,6 +7,7 @@
 # All rights reserved.
 #
 
+import contextlib
 import json
 import os
 from .translation_utils import _
@@ -21,6 +22,11 @@ class Settings:
         {"name": "BigLinux", "value": "biglinux"},
     ]
 
+    # value -> (index, organization), for O(1) lookups of a configured value
+    PREDEFINED_BY_VALUE = {
+        org["value"]: (i, org) for i, org in enumerate(PREDEFINED_ORGANIZATIONS)
+    }
+
     def __init__(self):
         # New config path: ~/.config/gitrepo/config.json
         self.config_dir = os.path.expanduser("~/.config/gitrepo")
@@ -31,6 +37,10 @@ class Settings:
         
         self.settings = self.load()
 
+        # set()/reset() only mark the settings dirty while inside batch()
+        self._batch_depth = 0
+        self._dirty = False
+
     def _migrate_old_config(self):
         """Migrate from old ~/.config/build-package/settings.json if exists"""
         old_config_file = os.path.expanduser("~/.config/build-package/settings.json")
@@ -146,14 +156,41 @@ class Settings:
         return self.settings.get(key, default)
 
     def set(self, key, value):
-        """Set setting value and save"""
+        """Set setting value and save; returns False if it was already set"""
+        if key in self.settings and self.settings[key] == value:
+            return False  # Unchanged, skip the write
         self.settings[key] = value
-        self.save()
+        self._save_or_defer()
+        return True
+
+    def set_many(self, values):
+        """Set several values with a single save; returns True if any changed"""
+        with self.batch():
+            changed = [self.set(key, value) for key, value in values.items()]
+        return any(changed)
 
     def reset(self):
         """Reset to defaults"""
         self.settings = self.get_defaults()
-        self.save()
+        self._save_or_defer()
+
+    def _save_or_defer(self):
+        if self._batch_depth:
+            self._dirty = True
+        else:
+            self.save()
+
+    @contextlib.contextmanager
+    def batch(self):
+        """Group several set()/reset() calls into a single save on exit"""
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if not self._batch_depth and self._dirty:
+                self._dirty = False
+                self.save()
 
     def is_feature_enabled(self, feature):
         """Check if a feature is enabled"""
@@ -21,6 +21,9 @@ class TokenStore:
         # comment lines are ignored
     """
 
+    # ((st_mtime_ns, st_size), entries) of the last parsed token file
+    _cache: tuple = (None, None)
+
     @staticmethod
     def _path() -> str:
         return os.path.expanduser(TOKEN_FILE)
@@ -48,8 +51,17 @@ class TokenStore:
         TokenStore.migrate_if_needed()
         token_file = TokenStore._path()
         entries: list[tuple[str, str]] = []
-        if not os.path.exists(token_file):
+        try:
+            st = os.stat(token_file)
+        except OSError:
             return entries
+
+        # Unchanged file: reuse the entries parsed last time
+        stat_key = (st.st_mtime_ns, st.st_size)
+        cached_key, cached_entries = TokenStore._cache
+        if cached_key == stat_key:
+            return list(cached_entries)
+
         try:
             with open(token_file) as f:
                 for raw in f:
@@ -62,7 +74,8 @@ class TokenStore:
                     else:
                         entries.append(("default", line))
         except Exception:
-            pass
+            return entries
+        TokenStore._cache = (stat_key, tuple(entries))
         return entries
 
     @staticmethod
@@ -72,6 +85,7 @@ class TokenStore:
         Returns ``True`` on success, ``False`` on any write error.
         """
         token_file = TokenStore._path()
+        TokenStore._cache = (None, None)
         try:
             os.makedirs(os.path.dirname(token_file), exist_ok=True)
             with open(token_file, 'w') as f:
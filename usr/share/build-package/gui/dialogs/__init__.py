@@ -7,12 +7,26 @@
 """
 Dialogs package for the GUI interface.
 Contains modal dialogs and confirmation windows.
+
+Dialog modules are imported lazily on first attribute access (PEP 562),
+so importing the package does not load every dialog at GUI startup.
 """
 
-from .conflict_dialog import ConflictDialog, ConflictFileRow
-from .preview_dialog import PreviewDialog, SimplePreviewDialog
-from .progress_dialog import OperationRunner, ProgressDialog, SimpleProgressDialog
-from .welcome_dialog import WelcomeDialog, should_show_welcome
+import importlib
+
+# Public name -> submodule that defines it
+_LAZY = {
+    "ConflictDialog": ".conflict_dialog",
+    "ConflictFileRow": ".conflict_dialog",
+    "PreferencesDialog": ".preferences_dialog",
+    "PreviewDialog": ".preview_dialog",
+    "SimplePreviewDialog": ".preview_dialog",
+    "OperationRunner": ".progress_dialog",
+    "ProgressDialog": ".progress_dialog",
+    "SimpleProgressDialog": ".progress_dialog",
+    "WelcomeDialog": ".welcome_dialog",
+    "should_show_welcome": ".welcome_dialog",
+}
 
 __all__ = [
     "ProgressDialog",
@@ -20,8 +34,23 @@ __all__ = [
     "OperationRunner",
     "ConflictDialog",
     "ConflictFileRow",
+    "PreferencesDialog",
     "PreviewDialog",
     "SimplePreviewDialog",
     "WelcomeDialog",
     "should_show_welcome",
-]
\ No newline at end of file
+]
+
+
+def __getattr__(name):
+    try:
+        module_name = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value  # Cache so later lookups skip __getattr__
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -8,70 +8,246 @@ import gi
 gi.require_version('Gtk', '4.0')
 gi.require_version('Adw', '1')
 
-from gi.repository import Gtk, Adw, GObject
+from gi.repository import Gtk, Adw, Gio, GLib, GObject
 from core.translation_utils import _
+
+# GtkSourceView is optional: when installed the diff panes are highlighted
+# natively, otherwise a minimal Python highlighter is used
+try:
+    gi.require_version('GtkSource', '5')
+    from gi.repository import GtkSource
+except (ValueError, ImportError):
+    GtkSource = None
+
+import collections
+import functools
+import mmap
+import shutil
 import subprocess
+import threading
 import os
 
+_UI_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Strings shown on every resolution change or diff dialog, translated once
+_LABELS = {
+    'resolved': _("Resolved {0} of {1} conflicts"),
+    'resolved_editing': _("Resolved {0} of {1} conflicts (editing manually)"),
+    'all_ours': _("All conflicts resolved (kept local versions)"),
+    'all_theirs': _("All conflicts resolved (accepted remote versions)"),
+    'editor_opened': _("File opened in {0}. After editing, click 'Mark as Edited' to continue."),
+    'compare_title': _("Compare: {0}"),
+    'maximize': _("Maximize"),
+    'local_label': _("<span foreground='#3584e4' weight='bold'>◀ LOCAL (Your Version)</span>"),
+    'remote_label': _("<span foreground='#2ec27e' weight='bold'>REMOTE (Server) ▶</span>"),
+    'local_header': _("<span foreground='#3584e4' weight='bold'>📁 LOCAL VERSION</span>"),
+    'remote_header': _("<span foreground='#2ec27e' weight='bold'>☁️ REMOTE VERSION</span>"),
+    'use_local': _("✓ Use LOCAL Version"),
+    'use_local_tip': _("Keep your local changes"),
+    'close': _("Close"),
+    'use_remote': _("✓ Use REMOTE Version"),
+    'use_remote_tip': _("Accept the remote server version"),
+    'missing_version': _("(this version of the file does not exist)"),
+}
+
+
+def _decode_blob(data):
+    """Decode git blob output as UTF-8, replacing invalid bytes"""
+    return data.decode('utf-8', errors='replace') if data else ""
+
+
+def _create_highlight_tag_table():
+    """Build the tag table shared by all fallback-highlighted diff panes"""
+    tag_table = Gtk.TextTagTable()
+    for name, prop, color in (
+        ("comment", "foreground", "#8b949e"),    # Gray for comments
+        ("keyword", "foreground", "#ff7b72"),    # Red for keywords
+        ("string", "foreground", "#a5d6ff"),     # Blue for strings
+        ("number", "foreground", "#79c0ff"),     # Light blue for numbers
+        ("bg-local", "background", "#1a2332"),   # Dark blue tint
+        ("bg-remote", "background", "#1a3320"),  # Dark green tint
+    ):
+        tag = Gtk.TextTag.new(name)
+        tag.set_property(prop, color)
+        tag_table.add(tag)
+    return tag_table
+
+
+# Editors tried for manual editing, in order of preference
+_EDITORS = (
+    # GUI editors
+    'code',      # VS Code
+    'codium',    # VSCodium
+    'kate',      # KDE Kate
+    'gedit',     # GNOME Gedit
+    'xed',       # Linux Mint Xed
+    'pluma',     # MATE Pluma
+    'mousepad',  # Xfce Mousepad
+    'leafpad',   # Lightweight
+    # Fallback to xdg-open (system default)
+    'xdg-open',
+)
+
+
+@functools.lru_cache(maxsize=1)
+def _available_editors():
+    """Return the installed editors from _EDITORS, looked up once on PATH"""
+    return tuple(editor for editor in _EDITORS if shutil.which(editor))
+
+
+class _CatFileBatch:
+    """A long-lived 'git cat-file --batch' process that reads blobs on demand"""
+
+    def __init__(self, repo_root):
+        self._proc = subprocess.Popen(
+            ["git", "cat-file", "--batch"],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            cwd=repo_root
+        )
+        self._lock = threading.Lock()  # One request/response at a time
+
+    def is_alive(self):
+        return self._proc.poll() is None
+
+    def read(self, spec):
+        """Return the content of an object spec (e.g. ':2:path') or None if missing"""
+        if "\n" in spec:
+            return None  # Cannot be expressed in the line-based protocol
+
+        with self._lock:
+            self._proc.stdin.write(spec.encode('utf-8') + b"\n")
+            self._proc.stdin.flush()
+
+            # Reply: "<sha> <type> <size>\n<content>\n" or "<spec> missing\n"
+            header = self._proc.stdout.readline()
+            if not header:
+                raise OSError("git cat-file exited unexpectedly")
+            header = header.rstrip(b"\n")
+            if header.endswith(b" missing") or header.endswith(b" ambiguous"):
+                return None
+            size = int(header.rsplit(b" ", 1)[1])
+            content = self._proc.stdout.read(size)
+            self._proc.stdout.read(1)  # Trailing newline
+            return content
+
+    def close(self):
+        """Let git exit by closing its input"""
+        try:
+            self._proc.stdin.close()
+            self._proc.wait(timeout=5)
+        except Exception:
+            self._proc.kill()
+
+
+def _read_decoded(batch, spec):
+    """Read and decode one object through a cat-file process, None if missing"""
+    content = batch.read(spec) if spec else None
+    return None if content is None else _decode_blob(content)
+
+
+# Decoded (ours, theirs) diff contents keyed by their (ours id, theirs id)
+# blob ids. Blob ids name their content, so entries stay valid across
+# dialogs and whichever dialog's cat-file process filled them.
+_BLOB_CACHE_SIZE = 256
+_blob_cache = collections.OrderedDict()
+_blob_cache_lock = threading.Lock()
+
+
+def _get_cached_blobs(key):
+    """Return cached contents for a blob id pair, or None"""
+    with _blob_cache_lock:
+        contents = _blob_cache.get(key)
+        if contents is not None:
+            _blob_cache.move_to_end(key)
+        return contents
+
+
+def _cache_blobs(key, contents):
+    """Remember contents for a blob id pair, dropping the oldest entry when full"""
+    with _blob_cache_lock:
+        _blob_cache[key] = contents
+        _blob_cache.move_to_end(key)
+        if len(_blob_cache) > _BLOB_CACHE_SIZE:
+            _blob_cache.popitem(last=False)
+
+
+class ConflictItem(GObject.Object):
+    """Model item for a single conflicted file"""
+
+    __gtype_name__ = 'ConflictItem'
+
+    filepath = GObject.Property(type=str, default="")
+    action = GObject.Property(type=str, default="")
+    resolved = GObject.Property(type=bool, default=False)
+
+    def __init__(self, filepath):
+        super().__init__(filepath=filepath)
+
+
+@Gtk.Template(filename=os.path.join(_UI_DIR, 'conflict_file_row.ui'))
 class ConflictFileRow(Adw.ActionRow):
-    """Row for a single conflicted file"""
+    """Row for a single conflicted file (widgets defined in conflict_file_row.ui)"""
 
     __gtype_name__ = 'ConflictFileRow'
 
-    def __init__(self, filepath):
+    status_icon = Gtk.Template.Child()
+
+    def __init__(self, filepath=None):
         super().__init__()
 
+        self.item = None
+        self._resolved_handler = None
         self.filepath = filepath
-        self.set_title(filepath)
-
-        # Status icon
-        self.status_icon = Gtk.Image.new_from_icon_name("dialog-warning-symbolic")
-        self.add_prefix(self.status_icon)
-
-        # Add action buttons
-        button_box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=6)
-
-        # Keep ours button
-        ours_button = Gtk.Button()
-        ours_button.set_label(_("Keep Local"))
-        ours_button.set_tooltip_text(_("Keep local version"))
-        ours_button.add_css_class("flat")
-        ours_button.connect('clicked', lambda b: self.emit('action-selected', 'ours'))
-        button_box.append(ours_button)
-
-        # Keep theirs button
-        theirs_button = Gtk.Button()
-        theirs_button.set_label(_("Accept Remote"))
-        theirs_button.set_tooltip_text(_("Accept remote version"))
-        theirs_button.add_css_class("flat")
-        theirs_button.connect('clicked', lambda b: self.emit('action-selected', 'theirs'))
-        button_box.append(theirs_button)
-
-        # Keep both button
-        both_button = Gtk.Button()
-        both_button.set_label(_("Keep Both"))
-        both_button.set_tooltip_text(_("Keep both versions"))
-        both_button.add_css_class("flat")
-        both_button.connect('clicked', lambda b: self.emit('action-selected', 'both'))
-        button_box.append(both_button)
-
-        # Show diff button (compare side-by-side)
-        diff_button = Gtk.Button()
-        diff_button.set_icon_name("view-dual-symbolic")
-        diff_button.set_tooltip_text(_("Compare versions side-by-side"))
-        diff_button.add_css_class("flat")
-        diff_button.connect('clicked', lambda b: self.emit('show-diff'))
-        button_box.append(diff_button)
-
-        # Edit manually button
-        edit_button = Gtk.Button()
-        edit_button.set_icon_name("document-edit-symbolic")
-        edit_button.set_tooltip_text(_("Edit file manually"))
-        edit_button.add_css_class("flat")
-        edit_button.connect('clicked', lambda b: self.emit('edit-file'))
-        button_box.append(edit_button)
-
-        self.add_suffix(button_box)
+        if filepath:
+            self.set_title(filepath)
+
+    def bind_item(self, item):
+        """Point this (possibly recycled) row at a ConflictItem"""
+        self.item = item
+        self.filepath = item.filepath
+        self.set_title(item.filepath)
+        self._update_status()
+        self._resolved_handler = item.connect('notify::resolved', self._on_item_resolved)
+
+    def unbind_item(self):
+        """Detach from the current ConflictItem so the row can be recycled"""
+        if self.item is not None and self._resolved_handler is not None:
+            self.item.disconnect(self._resolved_handler)
+        self._resolved_handler = None
+        self.item = None
+        self.filepath = None
+
+    def _on_item_resolved(self, item, pspec):
+        self._update_status()
+
+    def _update_status(self):
+        if self.item is not None and self.item.resolved:
+            self.mark_resolved()
+        else:
+            self.status_icon.set_from_icon_name("dialog-warning-symbolic")
+            self.remove_css_class("success")
+
+    @Gtk.Template.Callback()
+    def on_ours_clicked(self, button):
+        self.emit('action-selected', 'ours')
+
+    @Gtk.Template.Callback()
+    def on_theirs_clicked(self, button):
+        self.emit('action-selected', 'theirs')
+
+    @Gtk.Template.Callback()
+    def on_both_clicked(self, button):
+        self.emit('action-selected', 'both')
+
+    @Gtk.Template.Callback()
+    def on_diff_clicked(self, button):
+        self.emit('show-diff')
+
+    @Gtk.Template.Callback()
+    def on_edit_clicked(self, button):
+        self.emit('edit-file')
 
     def mark_resolved(self):
         """Mark file as resolved"""
@@ -89,6 +265,16 @@ class ConflictFileRow(Adw.ActionRow):
 class ConflictDialog(Adw.Window):
     """Visual dialog for resolving conflicts"""
 
+    # Characters inserted per idle iteration when filling large diff panes
+    _DIFF_CHUNK_SIZE = 64 * 1024
+    
+    # Above this many characters the fallback highlighter only tags the
+    # lines scrolled into view instead of walking the whole file
+    _HIGHLIGHT_VIEWPORT_THRESHOLD = 200_000
+    
+    # Highlight tags shared by every diff pane instead of created per pane
+    _SHARED_TAG_TABLE = _create_highlight_tag_table()
+
     __gsignals__ = {
         'conflicts-resolved': (GObject.SignalFlags.RUN_FIRST, None, (bool,)),  # success
     }
@@ -103,10 +289,21 @@ class ConflictDialog(Adw.Window):
         self.resolutions = {}  # filepath -> action
         self.resolved_count = 0
         self.repo_root = repo_root  # Git repo root for subprocess cwd
+        self._applying = False  # True while the apply worker runs git
+        self._stages = self._get_unmerged_stages()  # filepath -> {stage: blob id}
+
+        # cat-file process owned by this dialog, started by the first diff
+        # and stopped when the dialog closes (see _get_cat_file)
+        self._cat_file = None
+        self._cat_file_closed = False
+        self._cat_file_lock = threading.Lock()
 
         self.set_title(_("Resolve Conflicts"))
         self.set_default_size(800, 600)
 
+        # Cancel, Apply and the window's close button all end up here
+        self.connect('close-request', self._on_close_request)
+
         self.create_ui()
 
 
@@ -153,16 +350,16 @@ class ConflictDialog(Adw.Window):
         strategy_box.set_margin_bottom(6)
 
         # Auto-ours button
-        auto_ours_button = Gtk.Button()
-        auto_ours_button.set_label(_("Keep All Local"))
-        auto_ours_button.connect('clicked', self.on_auto_ours_clicked)
-        strategy_box.append(auto_ours_button)
+        self.auto_ours_button = Gtk.Button()
+        self.auto_ours_button.set_label(_("Keep All Local"))
+        self.auto_ours_button.connect('clicked', self.on_auto_ours_clicked)
+        strategy_box.append(self.auto_ours_button)
 
         # Auto-theirs button
-        auto_theirs_button = Gtk.Button()
-        auto_theirs_button.set_label(_("Accept All Remote"))
-        auto_theirs_button.connect('clicked', self.on_auto_theirs_clicked)
-        strategy_box.append(auto_theirs_button)
+        self.auto_theirs_button = Gtk.Button()
+        self.auto_theirs_button.set_label(_("Accept All Remote"))
+        self.auto_theirs_button.connect('clicked', self.on_auto_theirs_clicked)
+        strategy_box.append(self.auto_theirs_button)
 
         strategy_group.add(strategy_box)
         content_box.append(strategy_group)
@@ -177,19 +374,25 @@ class ConflictDialog(Adw.Window):
         scrolled.set_vexpand(True)
         scrolled.set_size_request(-1, 300)
 
-        # List box
-        self.conflicts_list = Gtk.ListBox()
-        self.conflicts_list.set_selection_mode(Gtk.SelectionMode.NONE)
-        self.conflicts_list.add_css_class("boxed-list")
-        scrolled.set_child(self.conflicts_list)
-
-        # Add conflict rows
+        # Conflict model - rows are only created for the visible part of the
+        # list and recycled while scrolling
+        self.model = Gio.ListStore.new(ConflictItem)
+        self._items_by_path = {}  # filepath -> ConflictItem
         for filepath in self.conflict_files:
-            row = ConflictFileRow(filepath)
-            row.connect('action-selected', self.on_file_action_selected)
-            row.connect('show-diff', self.on_show_diff)
-            row.connect('edit-file', self.on_edit_file)
-            self.conflicts_list.append(row)
+            item = ConflictItem(filepath)
+            self._items_by_path[filepath] = item
+            self.model.append(item)
+
+        factory = Gtk.SignalListItemFactory()
+        factory.connect('setup', self._on_row_setup)
+        factory.connect('bind', self._on_row_bind)
+        factory.connect('unbind', self._on_row_unbind)
+
+        # List view
+        self.conflicts_list = Gtk.ListView.new(Gtk.NoSelection.new(self.model), factory)
+        self.conflicts_list.set_show_separators(True)
+        self.conflicts_list.add_css_class("card")
+        scrolled.set_child(self.conflicts_list)
 
         conflicts_group.add(scrolled)
         content_box.append(conflicts_group)
@@ -199,11 +402,16 @@ class ConflictDialog(Adw.Window):
         bottom_bar.set_halign(Gtk.Align.END)
         toolbar_view.add_bottom_bar(bottom_bar)
 
+        # Spinner shown while resolutions are being applied
+        self.apply_spinner = Gtk.Spinner()
+        self.apply_spinner.set_visible(False)
+        bottom_bar.append(self.apply_spinner)
+
         # Cancel button
-        cancel_button = Gtk.Button()
-        cancel_button.set_label(_("Cancel"))
-        cancel_button.connect('clicked', self.on_cancel_clicked)
-        bottom_bar.append(cancel_button)
+        self.cancel_button = Gtk.Button()
+        self.cancel_button.set_label(_("Cancel"))
+        self.cancel_button.connect('clicked', self.on_cancel_clicked)
+        bottom_bar.append(self.cancel_button)
 
         # Apply button
         self.apply_button = Gtk.Button()
@@ -213,22 +421,44 @@ class ConflictDialog(Adw.Window):
         self.apply_button.connect('clicked', self.on_apply_clicked)
         bottom_bar.append(self.apply_button)
 
-    def on_file_action_selected(self, row, action):
-        """Handle action selection for a file"""
-        self.resolutions[row.filepath] = action
-        row.mark_resolved()
+    def _on_row_setup(self, factory, list_item):
+        """Create one reusable row widget for a list slot"""
+        row = ConflictFileRow()
+        row.connect('action-selected', self.on_file_action_selected)
+        row.connect('show-diff', self.on_show_diff)
+        row.connect('edit-file', self.on_edit_file)
+        list_item.set_child(row)
+
+    def _on_row_bind(self, factory, list_item):
+        list_item.get_child().bind_item(list_item.get_item())
+
+    def _on_row_unbind(self, factory, list_item):
+        list_item.get_child().unbind_item()
 
-        # Update button state
+    def _resolve_item(self, item, action):
+        """Record the resolution for a model item"""
+        self.resolutions[item.filepath] = action
+        item.action = action
+        item.resolved = True
+
+    def _update_resolved_state(self, status_format=None):
+        """Refresh the apply button and the banner after a resolution change"""
         self.resolved_count = len(self.resolutions)
-        self.apply_button.set_sensitive(self.resolved_count == len(self.conflict_files))
+        self.apply_button.set_sensitive(
+            not self._applying and self.resolved_count == len(self.conflict_files)
+        )
 
-        # Update status
+        if status_format is None:
+            status_format = _LABELS['resolved']
         self.status_banner.set_title(
-            _("Resolved {0} of {1} conflicts").format(
-                self.resolved_count, len(self.conflict_files)
-            )
+            status_format.format(self.resolved_count, len(self.conflict_files))
         )
 
+    def on_file_action_selected(self, row, action):
+        """Handle action selection for a file"""
+        self._resolve_item(row.item, action)
+        self._update_resolved_state()
+
     def on_show_diff(self, row):
         """Show diff for a file"""
         self.show_diff_dialog(row.filepath)
@@ -237,63 +467,30 @@ class ConflictDialog(Adw.Window):
         """Open file in external editor for manual editing"""
         filepath = row.filepath
         
-        # Try different editors in order of preference
-        editors = [
-            # GUI editors
-            'code',      # VS Code
-            'codium',    # VSCodium  
-            'kate',      # KDE Kate
-            'gedit',     # GNOME Gedit
-            'xed',       # Linux Mint Xed
-            'pluma',     # MATE Pluma
-            'mousepad',  # Xfce Mousepad
-            'leafpad',   # Lightweight
-            # Fallback to xdg-open (system default)
-            'xdg-open',
-        ]
-        
         editor_found = False
-        for editor in editors:
+        for editor in _available_editors():
             try:
-                # Check if editor exists
-                result = subprocess.run(
-                    ['which', editor],
-                    capture_output=True,
-                    check=False,
+                # Editor found, open file
+                subprocess.Popen(
+                    [editor, filepath],
+                    start_new_session=True,
                     cwd=self.repo_root
                 )
-                if result.returncode == 0:
-                    # Editor found, open file
-                    subprocess.Popen(
-                        [editor, filepath],
-                        start_new_session=True
-                    )
-                    editor_found = True
-                    
-                    # Show toast informing user
-                    toast = Adw.Toast.new(
-                        _("File opened in {0}. After editing, click 'Mark as Edited' to continue.").format(editor)
-                    )
-                    toast.set_timeout(5)
-                    if hasattr(self, 'toast_overlay'):
-                        self.toast_overlay.add_toast(toast)
-                    
-                    # Mark as "manual" resolution
-                    self.resolutions[row.filepath] = 'manual'
-                    row.mark_resolved()
-                    
-                    # Update button state
-                    self.resolved_count = len(self.resolutions)
-                    self.apply_button.set_sensitive(self.resolved_count == len(self.conflict_files))
-                    
-                    # Update status
-                    self.status_banner.set_title(
-                        _("Resolved {0} of {1} conflicts (editing manually)").format(
-                            self.resolved_count, len(self.conflict_files)
-                        )
-                    )
-                    break
-                    
+                editor_found = True
+                
+                # Show toast informing user
+                toast = Adw.Toast.new(
+                    _LABELS['editor_opened'].format(editor)
+                )
+                toast.set_timeout(5)
+                if hasattr(self, 'toast_overlay'):
+                    self.toast_overlay.add_toast(toast)
+                
+                # Mark as "manual" resolution
+                self._resolve_item(row.item, 'manual')
+                self._update_resolved_state(_LABELS['resolved_editing'])
+                break
+                
             except Exception:
                 continue
         
@@ -309,44 +506,24 @@ class ConflictDialog(Adw.Window):
 
     def show_diff_dialog(self, filepath):
         """Show side-by-side diff dialog with colors (MELD-style)"""
-        # Get both versions from git
-        try:
-            # Get "ours" version (local/current branch)
-            ours_result = subprocess.run(
-                ["git", "show", f":2:{filepath}"],
-                capture_output=True,
-                check=False,
-                cwd=self.repo_root
-            )
-            
-            # Get "theirs" version (remote/incoming)
-            theirs_result = subprocess.run(
-                ["git", "show", f":3:{filepath}"],
-                capture_output=True,
-                check=False,
-                cwd=self.repo_root
+        # Nothing to compare when neither side has a version of the file,
+        # so don't build the diff window at all
+        conflict_info = self._get_conflict_type(filepath)
+        if not conflict_info['ours_exists'] and not conflict_info['theirs_exists']:
+            message = Adw.MessageDialog.new(
+                self,
+                _("Cannot Compare Versions"),
+                _("Neither the local nor the remote version of this file exists:\n\n{0}").format(filepath)
             )
-            
-            # Try to decode as UTF-8, fallback to latin-1
-            try:
-                ours_content = ours_result.stdout.decode('utf-8') if ours_result.stdout else ""
-            except UnicodeDecodeError:
-                ours_content = ours_result.stdout.decode('latin-1', errors='replace') if ours_result.stdout else ""
-            
-            try:
-                theirs_content = theirs_result.stdout.decode('utf-8') if theirs_result.stdout else ""
-            except UnicodeDecodeError:
-                theirs_content = theirs_result.stdout.decode('latin-1', errors='replace') if theirs_result.stdout else ""
-            
-        except Exception as e:
-            ours_content = _("Error reading local version: {0}").format(str(e))
-            theirs_content = _("Error reading remote version: {0}").format(str(e))
+            message.add_response("ok", _("OK"))
+            message.present()
+            return
         
         # Create diff dialog - larger and maximizable
         dialog = Adw.Window(
             transient_for=self,
             modal=True,
-            title=_("Compare: {0}").format(filepath)
+            title=_LABELS['compare_title'].format(filepath)
         )
         dialog.set_default_size(1200, 700)
         
@@ -363,8 +540,8 @@ class ConflictDialog(Adw.Window):
         # Maximize button
         maximize_button = Gtk.Button()
         maximize_button.set_icon_name("view-fullscreen-symbolic")
-        maximize_button.set_tooltip_text(_("Maximize"))
-        maximize_button.connect('clicked', lambda b: dialog.maximize() if not dialog.is_maximized() else dialog.unmaximize())
+        maximize_button.set_tooltip_text(_LABELS['maximize'])
+        maximize_button.connect('clicked', self._on_diff_maximize_clicked, dialog)
         header.pack_end(maximize_button)
         
         main_box.append(header)
@@ -376,7 +553,7 @@ class ConflictDialog(Adw.Window):
         info_box.set_margin_bottom(8)
         
         local_label = Gtk.Label()
-        local_label.set_markup(_("<span foreground='#3584e4' weight='bold'>◀ LOCAL (Your Version)</span>"))
+        local_label.set_markup(_LABELS['local_label'])
         info_box.append(local_label)
         
         vs_label = Gtk.Label()
@@ -384,7 +561,7 @@ class ConflictDialog(Adw.Window):
         info_box.append(vs_label)
         
         remote_label = Gtk.Label()
-        remote_label.set_markup(_("<span foreground='#2ec27e' weight='bold'>REMOTE (Server) ▶</span>"))
+        remote_label.set_markup(_LABELS['remote_label'])
         info_box.append(remote_label)
         
         main_box.append(info_box)
@@ -401,7 +578,7 @@ class ConflictDialog(Adw.Window):
         left_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL)
         
         left_header = Gtk.Label()
-        left_header.set_markup(_("<span foreground='#3584e4' weight='bold'>📁 LOCAL VERSION</span>"))
+        left_header.set_markup(_LABELS['local_header'])
         left_header.set_margin_top(8)
         left_header.set_margin_bottom(4)
         left_box.append(left_header)
@@ -410,20 +587,13 @@ class ConflictDialog(Adw.Window):
         left_scrolled.set_policy(Gtk.PolicyType.AUTOMATIC, Gtk.PolicyType.AUTOMATIC)
         left_scrolled.set_vexpand(True)
         
-        left_text = Gtk.TextView()
-        left_text.set_editable(False)
-        left_text.set_monospace(True)
-        left_text.set_wrap_mode(Gtk.WrapMode.NONE)
-        left_text.set_left_margin(8)
-        left_text.set_right_margin(8)
-        left_text.set_top_margin(8)
-        left_text.set_bottom_margin(8)
-        
-        # Apply syntax highlighting with colors
-        self._apply_diff_highlighting(left_text, ours_content, is_local=True)
+        left_text = self._create_diff_view(filepath)
         
         left_scrolled.set_child(left_text)
-        left_box.append(left_scrolled)
+        
+        # Spinner until the local version has been read from git
+        left_stack = self._create_loading_stack(left_scrolled)
+        left_box.append(left_stack)
         left_frame.set_child(left_box)
         
         # Right side - REMOTE version (theirs)
@@ -433,7 +603,7 @@ class ConflictDialog(Adw.Window):
         right_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL)
         
         right_header = Gtk.Label()
-        right_header.set_markup(_("<span foreground='#2ec27e' weight='bold'>☁️ REMOTE VERSION</span>"))
+        right_header.set_markup(_LABELS['remote_header'])
         right_header.set_margin_top(8)
         right_header.set_margin_bottom(4)
         right_box.append(right_header)
@@ -442,34 +612,22 @@ class ConflictDialog(Adw.Window):
         right_scrolled.set_policy(Gtk.PolicyType.AUTOMATIC, Gtk.PolicyType.AUTOMATIC)
         right_scrolled.set_vexpand(True)
         
-        right_text = Gtk.TextView()
-        right_text.set_editable(False)
-        right_text.set_monospace(True)
-        right_text.set_wrap_mode(Gtk.WrapMode.NONE)
-        right_text.set_left_margin(8)
-        right_text.set_right_margin(8)
-        right_text.set_top_margin(8)
-        right_text.set_bottom_margin(8)
-        
-        # Apply syntax highlighting with colors
-        self._apply_diff_highlighting(right_text, theirs_content, is_local=False)
+        right_text = self._create_diff_view(filepath)
         
         right_scrolled.set_child(right_text)
-        right_box.append(right_scrolled)
-        right_frame.set_child(right_box)
         
-        # Sync scrolling between both views
-        left_vadj = left_scrolled.get_vadjustment()
-        right_vadj = right_scrolled.get_vadjustment()
-        
-        def sync_scroll_left(adj):
-            right_vadj.set_value(adj.get_value())
-        
-        def sync_scroll_right(adj):
-            left_vadj.set_value(adj.get_value())
+        # Spinner until the remote version has been read from git
+        right_stack = self._create_loading_stack(right_scrolled)
+        right_box.append(right_stack)
+        right_frame.set_child(right_box)
         
-        left_vadj.connect('value-changed', sync_scroll_left)
-        right_vadj.connect('value-changed', sync_scroll_right)
+        # Sync scrolling between both views. A binding keeps the values in
+        # step without calling back into Python, while each adjustment keeps
+        # its own range so the longer file can still be scrolled to the end.
+        left_scrolled.get_vadjustment().bind_property(
+            'value', right_scrolled.get_vadjustment(), 'value',
+            GObject.BindingFlags.BIDIRECTIONAL
+        )
         
         paned.set_start_child(left_frame)
         paned.set_end_child(right_frame)
@@ -487,9 +645,9 @@ class ConflictDialog(Adw.Window):
         
         # Use Local button
         use_local_btn = Gtk.Button()
-        use_local_btn.set_label(_("✓ Use LOCAL Version"))
+        use_local_btn.set_label(_LABELS['use_local'])
         use_local_btn.add_css_class("suggested-action")
-        use_local_btn.set_tooltip_text(_("Keep your local changes"))
+        use_local_btn.set_tooltip_text(_LABELS['use_local_tip'])
         
         def on_use_local(btn):
             self._apply_choice_from_diff(filepath, 'ours')
@@ -500,15 +658,15 @@ class ConflictDialog(Adw.Window):
         
         # Close without choosing
         close_btn = Gtk.Button()
-        close_btn.set_label(_("Close"))
-        close_btn.connect('clicked', lambda b: dialog.close())
+        close_btn.set_label(_LABELS['close'])
+        close_btn.connect('clicked', self._on_diff_close_clicked, dialog)
         action_bar.append(close_btn)
         
         # Use Remote button
         use_remote_btn = Gtk.Button()
-        use_remote_btn.set_label(_("✓ Use REMOTE Version"))
+        use_remote_btn.set_label(_LABELS['use_remote'])
         use_remote_btn.add_css_class("accent")
-        use_remote_btn.set_tooltip_text(_("Accept the remote server version"))
+        use_remote_btn.set_tooltip_text(_LABELS['use_remote_tip'])
         
         def on_use_remote(btn):
             self._apply_choice_from_diff(filepath, 'theirs')
@@ -520,47 +678,128 @@ class ConflictDialog(Adw.Window):
         main_box.append(action_bar)
         
         dialog.present()
+        
+        # Read both versions on a worker thread and fill the panes on the
+        # main thread once they are available
+        def fill_panes(ours_content, theirs_content):
+            # Apply syntax highlighting with colors
+            self._apply_diff_highlighting(left_text, ours_content, is_local=True)
+            self._apply_diff_highlighting(right_text, theirs_content, is_local=False)
+            left_stack.set_visible_child_name("content")
+            right_stack.set_visible_child_name("content")
+            return False
+        
+        def load_versions():
+            try:
+                ours_content, theirs_content = self._read_conflict_blobs(filepath)
+            except (OSError, ValueError) as e:
+                # The cat-file process died or was stopped, which affects
+                # both sides alike
+                ours_content = _("Error reading local version: {0}").format(str(e))
+                theirs_content = _("Error reading remote version: {0}").format(str(e))
+            
+            # A missing side only blanks its own pane
+            if ours_content is None:
+                ours_content = _LABELS['missing_version']
+            if theirs_content is None:
+                theirs_content = _LABELS['missing_version']
+            GLib.idle_add(fill_panes, ours_content, theirs_content)
+        
+        threading.Thread(target=load_versions, daemon=True).start()
     
-    def _apply_diff_highlighting(self, text_view, content, is_local=True):
-        """Apply syntax highlighting with colors to text view"""
-        buffer = text_view.get_buffer()
+    def _on_diff_maximize_clicked(self, button, dialog):
+        if dialog.is_maximized():
+            dialog.unmaximize()
+        else:
+            dialog.maximize()
+    
+    def _on_diff_close_clicked(self, button, dialog):
+        dialog.close()
+    
+    def _create_loading_stack(self, content):
+        """Wrap a diff pane in a stack that shows a spinner while loading"""
+        stack = Gtk.Stack()
+        stack.set_vexpand(True)
         
-        # Create tags for highlighting
-        tag_table = buffer.get_tag_table()
+        spinner = Gtk.Spinner()
+        spinner.set_size_request(32, 32)
+        spinner.set_halign(Gtk.Align.CENTER)
+        spinner.set_valign(Gtk.Align.CENTER)
+        spinner.start()
+        stack.add_named(spinner, "loading")
+        stack.add_named(content, "content")
         
-        # Create color tags if they don't exist
-        comment_tag = Gtk.TextTag.new("comment")
-        comment_tag.set_property("foreground", "#8b949e")  # Gray for comments
-        tag_table.add(comment_tag)
+        stack.set_visible_child_name("loading")
+        return stack
+    
+    def _create_diff_view(self, filepath):
+        """Create a read-only text view for one side of the diff"""
+        if GtkSource is not None:
+            buffer = GtkSource.Buffer()
+            language_manager = GtkSource.LanguageManager.get_default()
+            buffer.set_language(language_manager.guess_language(filepath, None))
+            scheme_name = 'Adwaita-dark' if Adw.StyleManager.get_default().get_dark() else 'Adwaita'
+            buffer.set_style_scheme(
+                GtkSource.StyleSchemeManager.get_default().get_scheme(scheme_name)
+            )
+            text_view = GtkSource.View.new_with_buffer(buffer)
+        else:
+            text_view = Gtk.TextView.new_with_buffer(
+                Gtk.TextBuffer.new(self._SHARED_TAG_TABLE)
+            )
         
-        keyword_tag = Gtk.TextTag.new("keyword")
-        keyword_tag.set_property("foreground", "#ff7b72")  # Red for keywords
-        tag_table.add(keyword_tag)
+        text_view.set_editable(False)
+        text_view.set_monospace(True)
+        text_view.set_wrap_mode(Gtk.WrapMode.NONE)
+        text_view.set_left_margin(8)
+        text_view.set_right_margin(8)
+        text_view.set_top_margin(8)
+        text_view.set_bottom_margin(8)
+        return text_view
+    
+    def _apply_diff_highlighting(self, text_view, content, is_local=True):
+        """Fill a diff view, highlighting it in Python when GtkSourceView is missing"""
+        buffer = text_view.get_buffer()
         
-        string_tag = Gtk.TextTag.new("string")
-        string_tag.set_property("foreground", "#a5d6ff")  # Blue for strings
-        tag_table.add(string_tag)
+        # GtkSourceView tokenizes the buffer itself
+        highlight = None
+        if GtkSource is None:
+            bg_tag = "bg-local" if is_local else "bg-remote"
+            if len(content) > self._HIGHLIGHT_VIEWPORT_THRESHOLD:
+                highlight = functools.partial(
+                    self._highlight_viewport, text_view=text_view, bg_tag=bg_tag
+                )
+            else:
+                highlight = functools.partial(self._highlight_buffer, bg_tag=bg_tag)
         
-        number_tag = Gtk.TextTag.new("number")
-        number_tag.set_property("foreground", "#79c0ff")  # Light blue for numbers
-        tag_table.add(number_tag)
+        # Small files are set in one go
+        if len(content) <= self._DIFF_CHUNK_SIZE:
+            buffer.set_text(content)
+            if highlight:
+                highlight(buffer, content)
+            return
         
-        # Background color based on side
-        if is_local:
-            bg_tag = Gtk.TextTag.new("bg")
-            bg_tag.set_property("background", "#1a2332")  # Dark blue tint
-        else:
-            bg_tag = Gtk.TextTag.new("bg")
-            bg_tag.set_property("background", "#1a3320")  # Dark green tint
-        tag_table.add(bg_tag)
+        # Large files are streamed in chunks from an idle handler so GTK can
+        # paint between chunks instead of freezing on a single set_text
+        chunk_starts = iter(range(0, len(content), self._DIFF_CHUNK_SIZE))
         
-        # Set the text
-        buffer.set_text(content)
+        def insert_next_chunk():
+            start = next(chunk_starts, None)
+            if start is None:
+                if highlight:
+                    highlight(buffer, content)
+                return False  # Done
+            buffer.insert(buffer.get_end_iter(), content[start:start + self._DIFF_CHUNK_SIZE])
+            return True  # Continue with the next chunk
         
+        GLib.idle_add(insert_next_chunk)
+    
+    def _highlight_buffer(self, buffer, content, bg_tag):
+        """Apply background and comment tags once the buffer holds all of content"""
         # Apply background to all text
         start = buffer.get_start_iter()
         end = buffer.get_end_iter()
-        buffer.apply_tag_by_name("bg", start, end)
+        buffer.apply_tag_by_name(bg_tag, start, end)
         
         # Apply simple syntax highlighting
         lines = content.split('\n')
@@ -576,57 +815,70 @@ class ConflictDialog(Adw.Window):
             
             offset += len(line) + 1  # +1 for newline
     
-    def _iter_conflict_rows(self):
-        """Iterate over ConflictFileRow children in the ListBox (GTK4 compatible)"""
-        idx = 0
-        while True:
-            row = self.conflicts_list.get_row_at_index(idx)
-            if row is None:
-                break
-            if isinstance(row, ConflictFileRow):
-                yield row
-            idx += 1
-
+    def _highlight_viewport(self, buffer, content, text_view, bg_tag):
+        """Apply the background once and comment tags only to visible lines"""
+        buffer.apply_tag_by_name(bg_tag, buffer.get_start_iter(), buffer.get_end_iter())
+        
+        highlighted_lines = set()
+        
+        def highlight_visible(*args):
+            rect = text_view.get_visible_rect()
+            _found, top = text_view.get_iter_at_location(rect.x, rect.y)
+            _found, bottom = text_view.get_iter_at_location(rect.x, rect.y + rect.height)
+            
+            for line in range(top.get_line(), bottom.get_line() + 1):
+                if line in highlighted_lines:
+                    continue
+                highlighted_lines.add(line)
+                
+                _found, line_start = buffer.get_iter_at_line(line)
+                line_end = line_start.copy()
+                if not line_end.ends_line():
+                    line_end.forward_to_line_end()
+                
+                # Comments (# or //)
+                text = buffer.get_text(line_start, line_end, False).strip()
+                if text.startswith(('#', '//')):
+                    buffer.apply_tag_by_name("comment", line_start, line_end)
+        
+        vadj = text_view.get_vadjustment()
+        vadj.connect('value-changed', highlight_visible)
+        vadj.connect('changed', highlight_visible)  # Resized or first allocation
+        highlight_visible()
+    
     def _apply_choice_from_diff(self, filepath, action):
         """Apply choice made from diff dialog"""
-        for child in self._iter_conflict_rows():
-            if child.filepath == filepath:
-                self.resolutions[filepath] = action
-                child.mark_resolved()
-
-                # Update button state
-                self.resolved_count = len(self.resolutions)
-                self.apply_button.set_sensitive(self.resolved_count == len(self.conflict_files))
-
-                # Update status
-                self.status_banner.set_title(
-                    _("Resolved {0} of {1} conflicts").format(
-                        self.resolved_count, len(self.conflict_files)
-                    )
-                )
-                break
+        item = self._items_by_path.get(filepath)
+        if item:
+            self._resolve_item(item, action)
+            self._update_resolved_state()
 
     def on_auto_ours_clicked(self, button):
         """Apply 'ours' to all unresolved conflicts"""
-        for child in self._iter_conflict_rows():
-            if child.filepath not in self.resolutions:
-                self.resolutions[child.filepath] = 'ours'
-                child.mark_resolved()
+        for filepath, item in self._items_by_path.items():
+            if filepath not in self.resolutions:
+                self._resolve_item(item, 'ours')
 
         self.resolved_count = len(self.resolutions)
-        self.apply_button.set_sensitive(True)
-        self.status_banner.set_title(_("All conflicts resolved (kept local versions)"))
+        self.apply_button.set_sensitive(not self._applying)
+        self.status_banner.set_title(_LABELS['all_ours'])
 
     def on_auto_theirs_clicked(self, button):
         """Apply 'theirs' to all unresolved conflicts"""
-        for child in self._iter_conflict_rows():
-            if child.filepath not in self.resolutions:
-                self.resolutions[child.filepath] = 'theirs'
-                child.mark_resolved()
+        for filepath, item in self._items_by_path.items():
+            if filepath not in self.resolutions:
+                self._resolve_item(item, 'theirs')
 
         self.resolved_count = len(self.resolutions)
-        self.apply_button.set_sensitive(True)
-        self.status_banner.set_title(_("All conflicts resolved (accepted remote versions)"))
+        self.apply_button.set_sensitive(not self._applying)
+        self.status_banner.set_title(_LABELS['all_theirs'])
+
+    def _on_close_request(self, window):
+        """Stop the cat-file process used by the diff viewer"""
+        if self._applying:
+            return True  # Keep the dialog until git has finished
+        self._close_cat_file()
+        return False
 
     def on_cancel_clicked(self, button):
         """Handle cancel"""
@@ -634,150 +886,237 @@ class ConflictDialog(Adw.Window):
         self.close()
 
     def on_apply_clicked(self, button):
-        """Apply all resolutions"""
-        # Apply each resolution
-        success = True
-        for filepath, action in self.resolutions.items():
-            if not self.apply_resolution(filepath, action):
-                success = False
-                break
+        """Apply all resolutions without blocking the GTK main loop"""
+        # Nothing may change the resolutions or close the dialog until the
+        # worker is done; _on_apply_done clears the flag
+        self._applying = True
+        self.apply_button.set_sensitive(False)
+        self.cancel_button.set_sensitive(False)
+        self.auto_ours_button.set_sensitive(False)
+        self.auto_theirs_button.set_sensitive(False)
+        self.conflicts_list.set_sensitive(False)
+
+        self.apply_spinner.set_visible(True)
+        self.apply_spinner.start()
+        self.status_banner.set_title(
+            _("Resolving {0} conflicted files...").format(len(self.resolutions))
+        )
+
+        # The dialog stays interactive, so the worker gets its own copy
+        threading.Thread(
+            target=self._apply_worker, args=(dict(self.resolutions),), daemon=True
+        ).start()
+
+    def _apply_worker(self, resolutions):
+        """Worker thread: run the git subprocesses for all resolutions"""
+        success, paths_to_add = self.apply_resolutions(resolutions)
 
         if success:
-            # Mark all as resolved in git
-            for filepath in self.resolutions.keys():
+            # Mark all as resolved in git with a single 'git add'.
+            # Files resolved with 'git rm' are already staged.
+            if paths_to_add:
                 try:
-                    # Check if file exists - files resolved with 'git rm' are already staged
-                    abs_filepath = os.path.join(self.repo_root, filepath) if self.repo_root else filepath
-                    if not os.path.exists(abs_filepath):
-                        continue
-                    subprocess.run(
-                        ["git", "add", filepath],
-                        check=True,
-                        capture_output=True,
-                        cwd=self.repo_root
-                    )
+                    self._run_git_with_paths(["add"], paths_to_add)
                 except Exception:
                     success = False
 
+        GLib.idle_add(self._on_apply_done, success)
+
+    def _on_apply_done(self, success):
+        """Finish applying resolutions on the main thread"""
+        self._applying = False
+        self.apply_spinner.stop()
+        self.apply_spinner.set_visible(False)
+
         self.emit('conflicts-resolved', success)
         self.close()
+        return False
 
-    def _get_conflict_type(self, filepath):
+    def _run_git_with_paths(self, args, paths):
         """
-        Detect the type of conflict for a file.
+        Run 'git <args>' on many paths in a single process.
 
-        Returns a dict with:
-            'ours_exists': bool - whether 'ours' (stage 2) version exists
-            'theirs_exists': bool - whether 'theirs' (stage 3) version exists
+        Paths go through stdin, NUL-separated, so the command line never
+        hits ARG_MAX however many files conflicted.
+        """
+        subprocess.run(
+            ["git"] + args + ["--pathspec-from-file=-", "--pathspec-file-nul"],
+            input="\0".join(paths).encode('utf-8'),
+            check=True,
+            capture_output=True,
+            cwd=self.repo_root
+        )
+
+    def _get_cat_file(self):
+        """Return this dialog's cat-file process, starting it on first use"""
+        with self._cat_file_lock:
+            if self._cat_file_closed:
+                # A loader finishing after close must not start a new one
+                raise OSError("conflict dialog is closed")
+            if self._cat_file is None or not self._cat_file.is_alive():
+                self._cat_file = _CatFileBatch(self.repo_root)
+            return self._cat_file
+
+    def _close_cat_file(self):
+        """Stop the cat-file process, if one was started"""
+        with self._cat_file_lock:
+            self._cat_file_closed = True
+            batch, self._cat_file = self._cat_file, None
+        if batch is not None:
+            batch.close()
+
+    def _read_conflict_blobs(self, filepath):
+        """
+        Return the decoded (ours, theirs) contents of a conflicted file,
+        with None for a side without a blob (e.g. deleted on that branch).
+
+        Sides are read by the blob ids recorded from 'git ls-files -u', so
+        the contents match the conflict this dialog was opened for, and
+        reopening a diff, even from a new dialog, is served from the cache.
+        """
+        stages = self._stages.get(filepath)
+        if stages is None:
+            # No stage info (ls-files failed): ask for the index entries
+            # by path, uncached since nothing identifies their content
+            batch = self._get_cat_file()
+            return (
+                _read_decoded(batch, f":2:{filepath}"),
+                _read_decoded(batch, f":3:{filepath}"),
+            )
+
+        key = (stages.get(2), stages.get(3))
+        contents = _get_cached_blobs(key)
+        if contents is None:
+            batch = self._get_cat_file()
+            contents = tuple(_read_decoded(batch, oid) for oid in key)
+            _cache_blobs(key, contents)
+        return contents
+
+    def _get_unmerged_stages(self):
+        """
+        Return {filepath: {stage: blob id}} for every unmerged path.
+
+        Uses a single 'git ls-files -u' for the whole index. If git cannot
+        be run this is empty, and every file is treated as modified on both
+        sides.
         """
         try:
             result = subprocess.run(
-                ["git", "ls-files", "-u", "--", filepath],
-                capture_output=True, text=True, check=False,
+                ["git", "ls-files", "-u", "-z"],
+                capture_output=True, check=False,
                 cwd=self.repo_root
             )
-            lines = result.stdout.strip().split('\n') if result.stdout.strip() else []
-            stages = set()
-            for line in lines:
-                parts = line.split('\t')[0].split()  # mode hash stage
-                if len(parts) >= 3:
-                    stages.add(int(parts[2]))
-
-            return {
-                'ours_exists': 2 in stages,
-                'theirs_exists': 3 in stages
-            }
         except Exception:
-            return {'ours_exists': True, 'theirs_exists': True}
+            return {}
+        stages = {}
+        for entry in result.stdout.decode('utf-8', errors='replace').split('\0'):
+            info, _tab, path = entry.partition('\t')
+            parts = info.split()  # mode hash stage
+            if path and len(parts) >= 3:
+                stages.setdefault(path, {})[int(parts[2])] = parts[1]
+        return stages
 
-    def apply_resolution(self, filepath, action):
-        """Apply resolution for a file"""
+    def _get_conflict_type(self, filepath):
+        """
+        Detect the type of conflict for a file.
+
+        Returns a dict with:
+            'ours_exists': bool - whether 'ours' (stage 2) version exists
+            'theirs_exists': bool - whether 'theirs' (stage 3) version exists
+        """
+        stages = self._stages.get(filepath, {2, 3})
+        return {
+            'ours_exists': 2 in stages,
+            'theirs_exists': 3 in stages
+        }
+
+    def _write_both_versions(self, filepaths):
+        """Write <file>.ours and <file>.theirs from index stages 2 and 3"""
+        # Everything goes through the dialog's cat-file process, by the blob
+        # ids from 'git ls-files -u' (content-addressed, so never stale),
+        # or by index path when there is no stage info for the file
+        batch = self._get_cat_file()
+
+        for filepath in filepaths:
+            abs_path = os.path.join(self.repo_root, filepath) if self.repo_root else filepath
+            stages = self._stages.get(filepath)
+            for stage, suffix in ((2, "ours"), (3, "theirs")):
+                spec = stages.get(stage) if stages is not None else f":{stage}:{filepath}"
+                content = batch.read(spec) if spec else None
+                if content is not None:  # Otherwise that side has no version
+                    with open(f"{abs_path}.{suffix}", 'wb') as f:
+                        f.write(content)
+
+    def _warn_conflict_markers(self, filepath):
+        """Warn if a manually edited file still has conflict markers"""
         try:
-            if action == 'ours':
-                conflict_info = self._get_conflict_type(filepath)
-                if not conflict_info['ours_exists']:
-                    # Our side deleted the file - remove it
-                    subprocess.run(
-                        ["git", "rm", "-f", filepath],
-                        check=True,
-                        capture_output=True,
-                        cwd=self.repo_root
-                    )
-                else:
-                    # Keep local version
-                    subprocess.run(
-                        ["git", "checkout", "--ours", filepath],
-                        check=True,
-                        capture_output=True,
-                        cwd=self.repo_root
-                    )
-            elif action == 'theirs':
-                conflict_info = self._get_conflict_type(filepath)
-                if not conflict_info['theirs_exists']:
-                    # Remote side deleted the file - remove it
-                    subprocess.run(
-                        ["git", "rm", "-f", filepath],
-                        check=True,
-                        capture_output=True,
-                        cwd=self.repo_root
-                    )
-                else:
-                    # Accept remote version
-                    subprocess.run(
-                        ["git", "checkout", "--theirs", filepath],
-                        check=True,
-                        capture_output=True,
-                        cwd=self.repo_root
-                    )
-            elif action == 'manual':
-                # User edited the file manually
-                # Just verify it doesn't have conflict markers
-                try:
-                    abs_path = os.path.join(self.repo_root, filepath) if self.repo_root else filepath
-                    with open(abs_path, 'r', errors='replace') as f:
-                        content = f.read()
-                        if '<<<<<<<' in content or '=======' in content or '>>>>>>>' in content:
-                            # Still has conflict markers - warn but continue
-                            print(_("Warning: {0} may still have conflict markers").format(filepath))
-                except Exception:
-                    pass
-                # File was edited, just return True
-                return True
-            elif action == 'both':
-                # Keep both versions by creating .ours and .theirs files
-                abs_path = os.path.join(self.repo_root, filepath) if self.repo_root else filepath
-                ours_file = f"{abs_path}.ours"
-                theirs_file = f"{abs_path}.theirs"
-
-                # Copy current conflicted file as base
-                import shutil
-                shutil.copy(abs_path, ours_file)
-                shutil.copy(abs_path, theirs_file)
-
-                # Checkout each version to respective file
-                subprocess.run(
-                    ["git", "checkout", "--ours", ours_file],
-                    check=False,
-                    capture_output=True,
-                    cwd=self.repo_root
-                )
-                subprocess.run(
-                    ["git", "checkout", "--theirs", theirs_file],
-                    check=False,
-                    capture_output=True,
-                    cwd=self.repo_root
+            abs_path = os.path.join(self.repo_root, filepath) if self.repo_root else filepath
+            if os.path.getsize(abs_path) == 0:
+                return  # Nothing to scan (and empty files cannot be mapped)
+
+            # Scan the raw bytes through a memory map instead of reading
+            # and decoding the whole file
+            with open(abs_path, 'rb') as f, \
+                    mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                has_markers = (
+                    mm.find(b'<<<<<<<') != -1
+                    or mm.find(b'=======') != -1
+                    or mm.find(b'>>>>>>>') != -1
                 )
+            if has_markers:
+                # Still has conflict markers - warn but continue
+                print(_("Warning: {0} may still have conflict markers").format(filepath))
+        except Exception:
+            pass
 
-                # Keep ours for the original file
-                subprocess.run(
-                    ["git", "checkout", "--ours", filepath],
-                    check=True,
-                    capture_output=True,
-                    cwd=self.repo_root
-                )
+    def apply_resolutions(self, resolutions):
+        """
+        Apply a {filepath: action} mapping.
 
-            return True
+        Files are grouped by what git has to do with them, so the whole set
+        costs one 'git checkout' per side and one 'git rm', with the
+        'both' side files read through the dialog's cat-file process.
+
+        Returns (success, paths_to_add): the files that still exist and
+        need a 'git add', i.e. everything not resolved with 'git rm'.
+        """
+        try:
+            checkout_paths = {'ours': [], 'theirs': []}
+            rm_paths = []
+            both_paths = []
+            for filepath, action in resolutions.items():
+                if action in checkout_paths:
+                    conflict_info = self._get_conflict_type(filepath)
+                    if conflict_info['ours_exists' if action == 'ours' else 'theirs_exists']:
+                        checkout_paths[action].append(filepath)
+                    else:
+                        # That side deleted the file - remove it
+                        rm_paths.append(filepath)
+                elif action == 'both':
+                    # Keep both versions by creating .ours and .theirs files,
+                    # and keep ours for the original file
+                    both_paths.append(filepath)
+                    checkout_paths['ours'].append(filepath)
+                elif action == 'manual':
+                    # User edited the file manually, just check for markers
+                    self._warn_conflict_markers(filepath)
+
+            if both_paths:
+                self._write_both_versions(both_paths)
+            for side, paths in checkout_paths.items():
+                if paths:
+                    self._run_git_with_paths(["checkout", f"--{side}"], paths)
+            if rm_paths:
+                self._run_git_with_paths(["rm", "-f"], rm_paths)
+
+            removed = set(rm_paths)
+            return True, [filepath for filepath in resolutions if filepath not in removed]
 
         except Exception as e:
-            print(_("Error resolving {0}: {1}").format(filepath, e))
-            return False
+            print(_("Error resolving {0}: {1}").format(", ".join(resolutions), e))
+            return False, []
+
+    def apply_resolution(self, filepath, action):
+        """Apply resolution for a file, returning (success, file_should_be_added)"""
+        success, paths_to_add = self.apply_resolutions({filepath: action})
+        return success, bool(paths_to_add)
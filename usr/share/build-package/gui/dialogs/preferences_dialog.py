@@ -7,6 +7,9 @@
 # All rights reserved.
 #
 
+import functools
+import os
+
 import gi
 
 gi.require_version("Gtk", "4.0")
@@ -16,106 +19,239 @@ gi.require_version("Adw", "1")
 from core.settings import Settings
 from core.token_store import TokenStore
 from core.translation_utils import _
-from gi.repository import Adw, Gio, Gtk
+from gi.repository import Adw, Gio, GLib, GObject, Gtk
+
+_UI_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Delay before text typed into an entry row is written to the settings file
+_ENTRY_SAVE_DELAY_MS = 250
+
+# Static strings, translated once at import instead of on every build/refresh
+
+# Preference pages: (name, title, icon), in display order
+_PAGES = (
+    ("features", _("Features"), "applications-system-symbolic"),
+    ("tokens", _("Tokens"), "dialog-password-symbolic"),
+    ("organization", _("Organization"), "system-users-symbolic"),
+    ("behavior", _("Behavior"), "preferences-system-symbolic"),
+)
+
+# Combo entries, in the same order as the setting values they select
+_MODE_LABELS = (
+    _("Safe – Show previews and confirmations"),
+    _("Quick – Fast with minimal confirmations"),
+    _("Expert – Maximum automation, no confirmations"),
+)
+_STRATEGY_LABELS = (
+    _("Interactive – Ask for each file"),
+    _("Auto-ours – Always keep local changes"),
+    _("Auto-theirs – Always accept remote changes"),
+    _("Manual – Stop and let me resolve"),
+)
+
+# Switch rows as (title, subtitle, setting key, default), one tuple per group
+_FEATURE_TOGGLES = (
+    (_("Package Generation"), _("Build and deploy packages via GitHub Actions"),
+     "package_features_enabled", False),
+    (_("AUR Packages"), _("Import and build packages from Arch User Repository"),
+     "aur_features_enabled", False),
+)
+_GIT_TOGGLES = (
+    (_("Auto-fetch before operations"), _("Fetch remote changes before commits and merges"),
+     "auto_fetch", True),
+    (_("Auto-switch to dev branch"), _("Automatically switch to your development branch"),
+     "auto_switch_branch", True),
+    (_("Auto-pull latest changes"), _("Automatically pull remote changes before operations"),
+     "auto_pull", False),
+    (_("Confirm destructive operations"), _("Ask before force push, reset --hard, etc"),
+     "confirm_destructive", True),
+    (_("Show git commands"), _("Display git commands before executing"),
+     "show_git_commands", False),
+)
+_VERSION_TOGGLES = (
+    (_("Auto-version bump"), _("Automatically increment version based on commit type"),
+     "auto_version_bump", True),
+)
+
+# Strings used again on every token list refresh or reset confirmation
+_LABELS = {
+    'no_tokens': _("No tokens configured"),
+    'no_tokens_hint': _("Use the form below to add a token"),
+    'delete_token': _("Delete token for {0}"),
+    'reset_done': _("Settings reset to defaults"),
+    'reset_heading': _("Reset Settings?"),
+    'reset_body': _("All settings will be restored to their default values. This cannot be undone."),
+    'cancel': _("Cancel"),
+    'reset': _("Reset"),
+}
+
+
+@functools.lru_cache(maxsize=256)
+def _mask(tok):
+    """Token as shown in the list: its first 8 characters only"""
+    return tok[:8] + "·····" if len(tok) > 8 else tok
+
+
+class OrgItem(GObject.Object):
+    """Organization combo entry: auto-detect, a predefined org, or custom"""
+
+    __gtype_name__ = 'OrgItem'
+
+    name = GObject.Property(type=str, default="")
+    value = GObject.Property(type=str, default="")
+    kind = GObject.Property(type=str, default="predefined")  # auto | predefined | custom
+
+    def __init__(self, name, value="", kind="predefined"):
+        super().__init__(name=name, value=value, kind=kind)
+
+
+@Gtk.Template(filename=os.path.join(_UI_DIR, 'preferences_organization_page.ui'))
+class OrganizationPage(Adw.PreferencesPage):
+    """Organization page (widgets defined in preferences_organization_page.ui)"""
+
+    __gtype_name__ = 'OrganizationPage'
+
+    org_combo = Gtk.Template.Child()
+    custom_org_row = Gtk.Template.Child()
+    workflow_row = Gtk.Template.Child()
+
+
+@functools.lru_cache(maxsize=1)
+def _org_store():
+    """Organization combo model, built once and shared (it is never modified).
+
+    Typed model with predefined + custom option; each entry says what
+    selecting it means, so the handler needs no index arithmetic.
+    """
+    store = Gio.ListStore.new(OrgItem)
+    store.splice(0, 0, [
+        OrgItem(_("Auto-detect"), kind="auto"),
+        # Use simple name for better display
+        *(OrgItem(org['name'], org['value']) for org in Settings.PREDEFINED_ORGANIZATIONS),
+        OrgItem(_("Custom"), kind="custom"),
+    ])
+    return store
 
 
 class PreferencesDialog(Adw.PreferencesDialog):
     """Preferences dialog for configuring GitRepo features and behavior"""
 
+    # Setting values in combo order (labels: _MODE_LABELS/_STRATEGY_LABELS)
+    _MODES = ("safe", "quick", "expert")
+    _MODE_INDEX = {mode: i for i, mode in enumerate(_MODES)}
+    _STRATEGIES = ("interactive", "auto-ours", "auto-theirs", "manual")
+    _STRATEGY_INDEX = {strategy: i for i, strategy in enumerate(_STRATEGIES)}
+
+    # Switch settings that enable optional features in the main window
+    _FEATURE_KEYS = frozenset({"package_features_enabled", "aur_features_enabled"})
+
+    # Pages whose static widgets come from a template instead of code
+    _PAGE_TYPES = {"organization": OrganizationPage}
+
     def __init__(self, parent_window, settings):
         super().__init__()
         self.settings = settings
         self.parent_window = parent_window
+        # Optional parent hooks, looked up once instead of probed per event
+        self._refresh_features = getattr(parent_window, "refresh_features", None)
+        self._show_toast = getattr(parent_window, "show_toast", None)
         self.needs_restart = False
+        self._synced_handlers = []  # (widget, handler id), blocked by _refresh_ui()
+        self._pending_writes = {}  # setting key -> (GLib source id, entry)
 
         self.set_title(_("Preferences"))
         self.set_content_width(560)
 
-        # Create preference pages
-        self._create_features_page()
-        self._create_tokens_page()
-        self._create_organization_page()
-        self._create_behavior_page()
+        # Pages start empty and are filled the first time they are shown
+        self._built = set()
+        self._setting_rows = {}  # setting key -> (SwitchRow, default), for refresh()
+        for name, title, icon_name in _PAGES:
+            page = self._PAGE_TYPES.get(name, Adw.PreferencesPage)()
+            page.set_name(name)
+            page.set_title(title)
+            page.set_icon_name(icon_name)
+            self.add(page)
+
+        self.connect("notify::visible-page", self._on_visible_page_changed)
+        self._on_visible_page_changed(self, None)
 
         # Connect close signal
         self.connect("closed", self._on_closed)
 
-    def _create_features_page(self):
-        """Create Features page with feature toggles"""
-        page = Adw.PreferencesPage()
-        page.set_title(_("Features"))
-        page.set_icon_name("applications-system-symbolic")
+    def _on_visible_page_changed(self, dialog, pspec):
+        """Build the contents of the shown page on its first visit"""
+        page = self.get_visible_page()
+        if page is None or page.get_name() in self._built:
+            return
+        self._built.add(page.get_name())
+        getattr(self, f"_build_{page.get_name()}_content")(page)
+
+    def _build_features_content(self, page):
+        """Fill Features page with feature toggles"""
 
         # Feature toggles group
         features_group = Adw.PreferencesGroup()
         features_group.set_title(_("Optional Features"))
         features_group.set_description(_("Enable or disable optional features."))
 
-        # Package Generation toggle
-        self.package_row = Adw.SwitchRow()
-        self.package_row.set_title(_("Package Generation"))
-        self.package_row.set_subtitle(_("Build and deploy packages via GitHub Actions"))
-        self.package_row.set_active(self.settings.get("package_features_enabled", False))
-        self.package_row.connect("notify::active", self._on_feature_toggle, "package_features_enabled")
-        features_group.add(self.package_row)
-
-        # AUR Package toggle
-        self.aur_row = Adw.SwitchRow()
-        self.aur_row.set_title(_("AUR Packages"))
-        self.aur_row.set_subtitle(_("Import and build packages from Arch User Repository"))
-        self.aur_row.set_active(self.settings.get("aur_features_enabled", False))
-        self.aur_row.connect("notify::active", self._on_feature_toggle, "aur_features_enabled")
-        features_group.add(self.aur_row)
+        for record in _FEATURE_TOGGLES:
+            self._make_switch_row(features_group, *record)
 
         # Note: ISO Builder is a separate project (build-iso)
 
         page.add(features_group)
 
-        self.add(page)
-
     # ── helpers for token file ─────────────────────────────────────────────
 
     def _refresh_token_rows(self):
-        """Rebuild the token list rows inside tokens_group."""
-        if hasattr(self, '_token_rows'):
-            for row in self._token_rows:
-                self.tokens_group.remove(row)
-        self._token_rows = []
-
+        """Sync the token list rows inside tokens_group with the token file.
+
+        Rows are keyed by (org, token): an org can appear more than once
+        (e.g. several bare tokens all read as "default") and each entry
+        keeps its own row. Only rows whose entry appeared or disappeared
+        are added or removed; a changed token replaces its row. Identical
+        duplicate lines share one row, as deleting removes them together.
+        """
         entries = TokenStore.read_all()
-        if not entries:
-            row = Adw.ActionRow()
-            row.set_title(_("No tokens configured"))
-            row.set_subtitle(_("Use the form below to add a token"))
-            self.tokens_group.add(row)
-            self._token_rows.append(row)
-            return
+        new_keys = set(entries)
+
+        for key in set(self._token_rows) - new_keys:
+            self.tokens_group.remove(self._token_rows.pop(key))
 
         for org, tok in entries:
+            if (org, tok) in self._token_rows:
+                continue
+
             row = Adw.ActionRow()
             row.set_title(org)
-            masked = tok[:8] + "·····" if len(tok) > 8 else tok
-            row.set_subtitle(masked)
+            row.set_subtitle(_mask(tok))
 
             del_btn = Gtk.Button()
             del_btn.set_icon_name("edit-delete-symbolic")
             del_btn.set_valign(Gtk.Align.CENTER)
             del_btn.add_css_class("destructive-action")
             del_btn.add_css_class("flat")
-            del_btn.update_property([Gtk.AccessibleProperty.LABEL], [_("Delete token for {0}").format(org)])
+            del_btn.update_property([Gtk.AccessibleProperty.LABEL], [_LABELS['delete_token'].format(org)])
             del_btn.connect('clicked', self._on_delete_token, org)
             row.add_suffix(del_btn)
 
             self.tokens_group.add(row)
-            self._token_rows.append(row)
+            self._token_rows[org, tok] = row
+
+        # Placeholder while no tokens are configured
+        if not entries and self._empty_token_row is None:
+            self._empty_token_row = Adw.ActionRow()
+            self._empty_token_row.set_title(_LABELS['no_tokens'])
+            self._empty_token_row.set_subtitle(_LABELS['no_tokens_hint'])
+            self.tokens_group.add(self._empty_token_row)
+        elif entries and self._empty_token_row is not None:
+            self.tokens_group.remove(self._empty_token_row)
+            self._empty_token_row = None
 
     # ── page builder ──────────────────────────────────────────────────────
 
-    def _create_tokens_page(self):
-        """Create GitHub Tokens page"""
-        page = Adw.PreferencesPage()
-        page.set_title(_("Tokens"))
-        page.set_icon_name("dialog-password-symbolic")
+    def _build_tokens_content(self, page):
+        """Fill GitHub Tokens page"""
 
         # — Guide group —
         guide_group = Adw.PreferencesGroup()
@@ -148,7 +284,8 @@ class PreferencesDialog(Adw.PreferencesDialog):
         self.tokens_group = Adw.PreferencesGroup()
         self.tokens_group.set_title(_("Configured Tokens"))
         self.tokens_group.set_description(_("Stored in ~/.config/gitrepo/github_token"))
-        self._token_rows = []
+        self._token_rows = {}  # (org, token) -> ActionRow
+        self._empty_token_row = None
         self._refresh_token_rows()
         page.add(self.tokens_group)
 
@@ -177,7 +314,6 @@ class PreferencesDialog(Adw.PreferencesDialog):
         add_group.add(save_row)
 
         page.add(add_group)
-        self.add(page)
 
     # ── token callbacks ───────────────────────────────────────────────────
 
@@ -190,14 +326,11 @@ class PreferencesDialog(Adw.PreferencesDialog):
 
         if TokenStore.upsert(org, tok):
             # Update live token in github_api if org matches current session
-            if hasattr(self.parent_window, 'build_package') and self.parent_window.build_package:
-                api = self.parent_window.build_package.github_api
-                if api.organization.lower() == org.lower():
-                    api.token = tok
-                    api.headers = {
-                        "Accept": "application/vnd.github.v3+json",
-                        "Authorization": f"token {tok}",
-                    }
+            build_package = self._get_build_package()
+            if build_package:
+                api = build_package.github_api
+                if api.is_organization(org):
+                    api.set_token(tok)
 
             self.token_org_entry.set_text("")
             self.token_value_entry.set_text("")
@@ -208,98 +341,47 @@ class PreferencesDialog(Adw.PreferencesDialog):
         TokenStore.delete(org)
         self._refresh_token_rows()
 
-    def _create_organization_page(self):
-        """Create Organization page for GitHub settings"""
-        page = Adw.PreferencesPage()
-        page.set_title(_("Organization"))
-        page.set_icon_name("system-users-symbolic")
+    def _build_organization_content(self, page):
+        """Fill Organization page for GitHub settings"""
         
-        # Organization group
-        org_group = Adw.PreferencesGroup()
-        org_group.set_title(_("GitHub Organization"))
-        org_group.set_description(
-            _("Configure your GitHub organization for package workflows")
-        )
-        
-        # Predefined organizations dropdown
-        self.org_combo = Adw.ComboRow()
-        self.org_combo.set_title(_("Organization"))
-        self.org_combo.set_subtitle(_("Select or enter custom organization"))
-        
-        # Create string list with predefined + custom option
-        org_list = Gtk.StringList()
-        org_list.append(_("Auto-detect"))
-        for org in Settings.PREDEFINED_ORGANIZATIONS:
-            # Use simple name for better display
-            org_list.append(org['name'])
-        org_list.append(_("Custom"))
-        
-        self.org_combo.set_model(org_list)
+        # The widget tree comes from the page template; only the model,
+        # current values and handlers are set up here
+        self.org_combo = page.org_combo
+        self.custom_org_row = page.custom_org_row
+        self.workflow_row = page.workflow_row
         
-        # Set current selection
+        self.org_combo.set_model(_org_store())
         current_org = self.settings.get("organization_name", "")
-        if not current_org:
-            self.org_combo.set_selected(0)  # Auto-detect
-        else:
-            # Find in predefined
-            found = False
-            for i, org in enumerate(Settings.PREDEFINED_ORGANIZATIONS):
-                if org['value'] == current_org:
-                    self.org_combo.set_selected(i + 1)
-                    found = True
-                    break
-            if not found:
-                self.org_combo.set_selected(len(Settings.PREDEFINED_ORGANIZATIONS) + 1)  # Custom
         
-        self.org_combo.connect("notify::selected", self._on_org_selected)
-        org_group.add(self.org_combo)
+        # Set current selection
+        self.org_combo.set_selected(self._org_index(current_org))
+        self._connect_synced(self.org_combo, "notify::selected-item", self._on_org_selected)
         
-        # Custom organization entry (shown when "Custom" is selected)
-        self.custom_org_row = Adw.EntryRow()
-        self.custom_org_row.set_title(_("Custom Organization"))
-        self.custom_org_row.set_text(self.settings.get("organization_name", ""))
-        self.custom_org_row.connect("changed", self._on_custom_org_changed)
+        self.custom_org_row.set_text(current_org)
+        self._connect_synced(self.custom_org_row, "changed", self._on_custom_org_changed)
         
         # Show/hide based on selection
-        current_org = self.settings.get("organization_name", "")
-        is_custom = current_org and not any(
-            org['value'] == current_org for org in Settings.PREDEFINED_ORGANIZATIONS
-        )
-        self.custom_org_row.set_visible(is_custom)
+        self.custom_org_row.set_visible(self._is_custom_org(current_org))
         
-        org_group.add(self.custom_org_row)
-        
-        page.add(org_group)
-        
-        # Workflow repository group
-        workflow_group = Adw.PreferencesGroup()
-        workflow_group.set_title(_("Workflow Configuration"))
-        workflow_group.set_description(
-            _("Repository containing GitHub Actions workflows")
-        )
-        
-        self.workflow_row = Adw.EntryRow()
-        self.workflow_row.set_title(_("Workflow Repository"))
         self.workflow_row.set_text(self.settings.get("workflow_repository", ""))
-        self.workflow_row.connect("changed", self._on_workflow_changed)
-        workflow_group.add(self.workflow_row)
-        
-        # Hint with actual default value from config.py
-        hint_row = Adw.ActionRow()
-        hint_row.set_title(_("💡 Tip"))
-        hint_row.set_subtitle(_("Leave empty to use default: big-comm/build-package"))
-        hint_row.set_activatable(False)
-        workflow_group.add(hint_row)
-        
-        page.add(workflow_group)
-        
-        self.add(page)
+        self._connect_synced(self.workflow_row, "changed", self._on_workflow_changed)
+    
+    @staticmethod
+    def _org_index(current_org):
+        """Combo index for an organization: auto-detect, predefined or custom"""
+        if not current_org:
+            return 0  # Auto-detect
+        predefined = Settings.PREDEFINED_BY_VALUE.get(current_org)
+        if predefined:
+            return predefined[0] + 1
+        return len(Settings.PREDEFINED_ORGANIZATIONS) + 1  # Custom
+    
+    @staticmethod
+    def _is_custom_org(current_org):
+        return bool(current_org) and current_org not in Settings.PREDEFINED_BY_VALUE
     
-    def _create_behavior_page(self):
-        """Create Behavior page for operation settings"""
-        page = Adw.PreferencesPage()
-        page.set_title(_("Behavior"))
-        page.set_icon_name("preferences-system-symbolic")
+    def _build_behavior_content(self, page):
+        """Fill Behavior page for operation settings"""
 
         # ── Operation mode ────────────────────────────────────────────────
         mode_group = Adw.PreferencesGroup()
@@ -309,33 +391,21 @@ class PreferencesDialog(Adw.PreferencesDialog):
         self.mode_row = Adw.ComboRow()
         self.mode_row.set_title(_("Mode"))
         self.mode_row.set_subtitle(_("Select your preferred operation mode"))
-        modes_list = Gtk.StringList()
-        modes_list.append(_("Safe – Show previews and confirmations"))
-        modes_list.append(_("Quick – Fast with minimal confirmations"))
-        modes_list.append(_("Expert – Maximum automation, no confirmations"))
+        modes_list = Gtk.StringList.new(_MODE_LABELS)
         self.mode_row.set_model(modes_list)
-        mode_index = {"safe": 0, "quick": 1, "expert": 2}.get(self.settings.get("operation_mode", "safe"), 0)
-        self.mode_row.set_selected(mode_index)
-        self.mode_row.connect("notify::selected", self._on_mode_changed)
+        self.mode_row.set_selected(self._MODE_INDEX.get(self.settings.get("operation_mode", "safe"), 0))
+        self._connect_synced(self.mode_row, "notify::selected", self._on_mode_changed)
         mode_group.add(self.mode_row)
 
         self.strategy_row = Adw.ComboRow()
         self.strategy_row.set_title(_("Conflict Strategy"))
         self.strategy_row.set_subtitle(_("How to resolve merge conflicts"))
-        strategies_list = Gtk.StringList()
-        strategies_list.append(_("Interactive – Ask for each file"))
-        strategies_list.append(_("Auto-ours – Always keep local changes"))
-        strategies_list.append(_("Auto-theirs – Always accept remote changes"))
-        strategies_list.append(_("Manual – Stop and let me resolve"))
+        strategies_list = Gtk.StringList.new(_STRATEGY_LABELS)
         self.strategy_row.set_model(strategies_list)
-        strategy_index = {
-            "interactive": 0,
-            "auto-ours": 1,
-            "auto-theirs": 2,
-            "manual": 3,
-        }.get(self.settings.get("conflict_strategy", "interactive"), 0)
-        self.strategy_row.set_selected(strategy_index)
-        self.strategy_row.connect("notify::selected", self._on_strategy_changed)
+        self.strategy_row.set_selected(
+            self._STRATEGY_INDEX.get(self.settings.get("conflict_strategy", "interactive"), 0)
+        )
+        self._connect_synced(self.strategy_row, "notify::selected", self._on_strategy_changed)
         mode_group.add(self.strategy_row)
 
         page.add(mode_group)
@@ -344,40 +414,8 @@ class PreferencesDialog(Adw.PreferencesDialog):
         git_group = Adw.PreferencesGroup()
         git_group.set_title(_("Git Operations"))
 
-        auto_fetch_row = Adw.SwitchRow()
-        auto_fetch_row.set_title(_("Auto-fetch before operations"))
-        auto_fetch_row.set_subtitle(_("Fetch remote changes before commits and merges"))
-        auto_fetch_row.set_active(self.settings.get("auto_fetch", True))
-        auto_fetch_row.connect("notify::active", self._on_setting_toggle, "auto_fetch")
-        git_group.add(auto_fetch_row)
-
-        auto_switch_row = Adw.SwitchRow()
-        auto_switch_row.set_title(_("Auto-switch to dev branch"))
-        auto_switch_row.set_subtitle(_("Automatically switch to your development branch"))
-        auto_switch_row.set_active(self.settings.get("auto_switch_branch", True))
-        auto_switch_row.connect("notify::active", self._on_setting_toggle, "auto_switch_branch")
-        git_group.add(auto_switch_row)
-
-        auto_pull_row = Adw.SwitchRow()
-        auto_pull_row.set_title(_("Auto-pull latest changes"))
-        auto_pull_row.set_subtitle(_("Automatically pull remote changes before operations"))
-        auto_pull_row.set_active(self.settings.get("auto_pull", False))
-        auto_pull_row.connect("notify::active", self._on_setting_toggle, "auto_pull")
-        git_group.add(auto_pull_row)
-
-        confirm_row = Adw.SwitchRow()
-        confirm_row.set_title(_("Confirm destructive operations"))
-        confirm_row.set_subtitle(_("Ask before force push, reset --hard, etc"))
-        confirm_row.set_active(self.settings.get("confirm_destructive", True))
-        confirm_row.connect("notify::active", self._on_setting_toggle, "confirm_destructive")
-        git_group.add(confirm_row)
-
-        show_commands_row = Adw.SwitchRow()
-        show_commands_row.set_title(_("Show git commands"))
-        show_commands_row.set_subtitle(_("Display git commands before executing"))
-        show_commands_row.set_active(self.settings.get("show_git_commands", False))
-        show_commands_row.connect("notify::active", self._on_setting_toggle, "show_git_commands")
-        git_group.add(show_commands_row)
+        for record in _GIT_TOGGLES:
+            self._make_switch_row(git_group, *record)
 
         page.add(git_group)
 
@@ -385,12 +423,8 @@ class PreferencesDialog(Adw.PreferencesDialog):
         version_group = Adw.PreferencesGroup()
         version_group.set_title(_("Version Management"))
 
-        auto_version_row = Adw.SwitchRow()
-        auto_version_row.set_title(_("Auto-version bump"))
-        auto_version_row.set_subtitle(_("Automatically increment version based on commit type"))
-        auto_version_row.set_active(self.settings.get("auto_version_bump", True))
-        auto_version_row.connect("notify::active", self._on_setting_toggle, "auto_version_bump")
-        version_group.add(auto_version_row)
+        for record in _VERSION_TOGGLES:
+            self._make_switch_row(version_group, *record)
 
         page.add(version_group)
 
@@ -412,64 +446,104 @@ class PreferencesDialog(Adw.PreferencesDialog):
         reset_group.add(reset_row)
         page.add(reset_group)
 
-        self.add(page)
-
     def _on_mode_changed(self, combo, pspec):
         """Save operation_mode from combo selection."""
-        modes = ["safe", "quick", "expert"]
         idx = combo.get_selected()
-        if idx < len(modes):
-            self.settings.set("operation_mode", modes[idx])
+        if idx < len(self._MODES):
+            self.settings.set("operation_mode", self._MODES[idx])
 
     def _on_strategy_changed(self, combo, pspec):
         """Save conflict_strategy from combo selection."""
-        strategies = ["interactive", "auto-ours", "auto-theirs", "manual"]
         idx = combo.get_selected()
-        if idx < len(strategies):
-            self.settings.set("conflict_strategy", strategies[idx])
-    
-    def _on_feature_toggle(self, switch, pspec, setting_key):
-        """Handle feature toggle change"""
-        self.settings.set(setting_key, switch.get_active())
-        if hasattr(self.parent_window, "refresh_features"):
-            self.parent_window.refresh_features()
+        if idx < len(self._STRATEGIES):
+            self.settings.set("conflict_strategy", self._STRATEGIES[idx])
     
-    def _on_setting_toggle(self, switch, pspec, setting_key):
-        """Handle setting toggle change"""
-        self.settings.set(setting_key, switch.get_active())
+    def _make_switch_row(self, group, title, subtitle, setting_key, default):
+        """Add a switch row bound to *setting_key* to *group*"""
+        row = Adw.SwitchRow()
+        row.set_title(title)
+        row.set_subtitle(subtitle)
+        row.set_active(self.settings.get(setting_key, default))
+        row.setting_key = setting_key  # Read back by _on_setting_toggle
+        self._connect_synced(row, "notify::active", self._on_setting_toggle)
+        self._setting_rows[setting_key] = (row, default)
+        group.add(row)
+        return row
+
+    def _connect_synced(self, widget, signal, handler):
+        """Connect a handler that _refresh_ui() blocks while it sets the widget"""
+        handler_id = widget.connect(signal, handler)
+        self._synced_handlers.append((widget, handler_id))
+        return handler_id
+
+    def _on_setting_toggle(self, switch, pspec):
+        """Handle any switch row change (rows carry their setting key)"""
+        setting_key = switch.setting_key
+        changed = self.settings.set(setting_key, switch.get_active())
+        # Feature toggles also change what the main window shows
+        if changed and setting_key in self._FEATURE_KEYS and self._refresh_features:
+            self._refresh_features()
     
     def _on_org_selected(self, combo, pspec):
         """Handle organization selection"""
-        selected = combo.get_selected()
+        item = combo.get_selected_item()
+        if item is None:
+            return
         
-        if selected == 0:
-            # Auto-detect
-            self.settings.set("organization_name", "")
-            self.settings.set("workflow_repository", "")  # Clear workflow too
-            self.workflow_row.set_text("")
-            self.custom_org_row.set_visible(False)
-        elif selected <= len(Settings.PREDEFINED_ORGANIZATIONS):
-            # Predefined organization
-            org = Settings.PREDEFINED_ORGANIZATIONS[selected - 1]
-            self.settings.set("organization_name", org['value'])
-            self.custom_org_row.set_visible(False)
-            
-            # Auto-fill workflow repository
-            workflow = f"{org['value']}/build-package"
-            self.settings.set("workflow_repository", workflow)
-            self.workflow_row.set_text(workflow)
-        else:
-            # Custom
+        if item.kind == "custom":
             self.custom_org_row.set_visible(True)
             # Don't clear the value, user might want to edit existing
+            return
+        
+        if item.kind == "auto":
+            workflow = ""  # Clear workflow too
+        else:
+            # Auto-fill workflow repository
+            workflow = f"{item.value}/build-package"
+        
+        # Organization and workflow are saved together, with one write.
+        # Typing still waiting to be saved is superseded by this choice.
+        self._cancel_entry_write("organization_name")
+        self._cancel_entry_write("workflow_repository")
+        self.settings.set_many({
+            "organization_name": item.value,
+            "workflow_repository": workflow,
+        })
+        self.workflow_row.set_text(workflow)
+        self.custom_org_row.set_visible(False)
     
     def _on_custom_org_changed(self, entry):
         """Handle custom organization entry change"""
-        self.settings.set("organization_name", entry.get_text())
+        self._schedule_entry_write("organization_name", entry)
     
     def _on_workflow_changed(self, entry):
         """Handle workflow repository entry change"""
-        self.settings.set("workflow_repository", entry.get_text())
+        self._schedule_entry_write("workflow_repository", entry)
+    
+    def _schedule_entry_write(self, key, entry):
+        """Save an entry's text once typing pauses instead of per keystroke"""
+        self._cancel_entry_write(key)
+        if entry.get_text() == self.settings.get(key):
+            return  # e.g. typed and erased again, or set to the stored value
+        source_id = GLib.timeout_add(_ENTRY_SAVE_DELAY_MS, self._write_entry, key, entry)
+        self._pending_writes[key] = (source_id, entry)
+    
+    def _write_entry(self, key, entry):
+        self._pending_writes.pop(key, None)
+        self.settings.set(key, entry.get_text())
+        return False
+    
+    def _cancel_entry_write(self, key):
+        pending = self._pending_writes.pop(key, None)
+        if pending:
+            GLib.source_remove(pending[0])
+    
+    def _flush_entry_writes(self):
+        """Write any entry text still waiting for its save delay"""
+        pending, self._pending_writes = self._pending_writes, {}
+        for source_id, _entry in pending.values():
+            GLib.source_remove(source_id)
+        self.settings.set_many({key: entry.get_text() for key, (_id, entry) in pending.items()})
     
     def _on_reset_clicked(self, button):
         """Handle reset to defaults"""
@@ -477,12 +551,10 @@ class PreferencesDialog(Adw.PreferencesDialog):
             transient_for=self,
             modal=True
         )
-        dialog.set_heading(_("Reset Settings?"))
-        dialog.set_body(
-            _("All settings will be restored to their default values. This cannot be undone.")
-        )
-        dialog.add_response("cancel", _("Cancel"))
-        dialog.add_response("reset", _("Reset"))
+        dialog.set_heading(_LABELS['reset_heading'])
+        dialog.set_body(_LABELS['reset_body'])
+        dialog.add_response("cancel", _LABELS['cancel'])
+        dialog.add_response("reset", _LABELS['reset'])
         dialog.set_response_appearance("reset", Adw.ResponseAppearance.DESTRUCTIVE)
         dialog.set_default_response("cancel")
         dialog.set_close_response("cancel")
@@ -493,35 +565,59 @@ class PreferencesDialog(Adw.PreferencesDialog):
     def _on_reset_response(self, dialog, response):
         """Handle reset confirmation response"""
         if response == "reset":
-            self.settings.reset()
-            # Refresh UI
-            self._refresh_ui()
-            if hasattr(self.parent_window, "refresh_features"):
-                self.parent_window.refresh_features()
+            for key in list(self._pending_writes):
+                self._cancel_entry_write(key)
+            with self.settings.batch():
+                self.settings.reset()
+                # Refresh UI
+                self._refresh_ui()
+            if self._refresh_features:
+                self._refresh_features()
             # Show toast
-            if hasattr(self.parent_window, 'show_toast'):
-                self.parent_window.show_toast(_("Settings reset to defaults"))
+            if self._show_toast:
+                self._show_toast(_LABELS['reset_done'])
+    
+    def refresh(self):
+        """Re-sync a reused dialog with the token file and current settings"""
+        if "tokens" in self._built:
+            self._refresh_token_rows()
+        self._refresh_ui()
     
     def _refresh_ui(self):
         """Refresh UI to reflect current settings"""
-        self.package_row.set_active(self.settings.get("package_features_enabled", False))
-        self.aur_row.set_active(self.settings.get("aur_features_enabled", False))
-        self.org_combo.set_selected(0)
-        self.custom_org_row.set_text("")
-        self.workflow_row.set_text("")
-        mode_index = {"safe": 0, "quick": 1, "expert": 2}.get(self.settings.get("operation_mode", "safe"), 0)
-        self.mode_row.set_selected(mode_index)
-        strategy_index = {
-            "interactive": 0,
-            "auto-ours": 1,
-            "auto-theirs": 2,
-            "manual": 3,
-        }.get(self.settings.get("conflict_strategy", "interactive"), 0)
-        self.strategy_row.set_selected(strategy_index)
+        # Pages that were never shown read the settings when they are built.
+        # Widgets are being set from the settings here, not by the user, so
+        # their handlers are blocked instead of writing the values back.
+        for widget, handler_id in self._synced_handlers:
+            widget.handler_block(handler_id)
+        try:
+            # Only rows of built pages are registered here
+            for key, (row, default) in self._setting_rows.items():
+                row.set_active(self.settings.get(key, default))
+            if "organization" in self._built:
+                current_org = self.settings.get("organization_name", "")
+                self.org_combo.set_selected(self._org_index(current_org))
+                self.custom_org_row.set_text(current_org)
+                self.custom_org_row.set_visible(self._is_custom_org(current_org))
+                self.workflow_row.set_text(self.settings.get("workflow_repository", ""))
+            if "behavior" in self._built:
+                self.mode_row.set_selected(
+                    self._MODE_INDEX.get(self.settings.get("operation_mode", "safe"), 0)
+                )
+                self.strategy_row.set_selected(
+                    self._STRATEGY_INDEX.get(self.settings.get("conflict_strategy", "interactive"), 0)
+                )
+        finally:
+            for widget, handler_id in self._synced_handlers:
+                widget.handler_unblock(handler_id)
+    
+    def _get_build_package(self):
+        """Current BuildPackage of the parent (it may be created after the dialog)"""
+        return getattr(self.parent_window, "build_package", None)
     
     def _on_closed(self, dialog):
         """Sync conflict_strategy to the running build_package instance."""
-        if hasattr(self.parent_window, "build_package") and self.parent_window.build_package:
-            bp = self.parent_window.build_package
-            if hasattr(bp, "conflict_resolver"):
-                bp.conflict_resolver.strategy = self.settings.get("conflict_strategy", "interactive")
+        self._flush_entry_writes()
+        conflict_resolver = getattr(self._get_build_package(), "conflict_resolver", None)
+        if conflict_resolver:
+            conflict_resolver.strategy = self.settings.get("conflict_strategy", "interactive")
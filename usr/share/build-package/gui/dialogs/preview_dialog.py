@@ -8,46 +8,93 @@ import gi
 gi.require_version('Gtk', '4.0')
 gi.require_version('Adw', '1')
 
-from gi.repository import Gtk, Adw, GObject
+from gi.repository import Gtk, Adw, Gio, GObject
 from core.translation_utils import _
 
+# Row title, translated once; translations may reorder the fields, so the
+# "[i/N] " part cannot be prebuilt as a prefix
+_TITLE_FORMAT = _("[{0}/{1}] {2}")
+
+# Summary markup, filled in with the operation count
+_SAFE_MARKUP = '<span color="green">✓ {0} safe operations</span>'
+_DESTRUCTIVE_MARKUP = '<span color="red">⚠ {0} destructive operations</span>'
+
+# libadwaita versions without extra-child get the details appended to the body
+_HAS_EXTRA_CHILD = hasattr(Adw.MessageDialog, "set_extra_child")
+
+
+def _attach_extra(dialog, widget, fallback_text):
+    """Show widget below the dialog body, or append fallback_text() to the body"""
+    if _HAS_EXTRA_CHILD:
+        dialog.set_extra_child(widget)
+    else:
+        dialog.set_body(dialog.get_body() + "\n\n" + fallback_text())
+
+
+class PreviewOperationItem(GObject.Object):
+    """Model item for a single operation in preview, with its row text precomputed"""
+
+    __gtype_name__ = 'PreviewOperationItem'
+
+    title = GObject.Property(type=str, default="")
+    subtitle = GObject.Property(type=str, default="")
+    icon_name = GObject.Property(type=str, default="")
+    destructive = GObject.Property(type=bool, default=False)
+
+    def __init__(self, title, subtitle, icon_name, destructive):
+        super().__init__(
+            title=title, subtitle=subtitle, icon_name=icon_name, destructive=destructive
+        )
+
 
 class PreviewOperationRow(Adw.ActionRow):
-    """Row for a single operation in preview"""
+    """Row for a single operation in preview, recycled by the list view"""
 
     __gtype_name__ = 'PreviewOperationRow'
 
-    def __init__(self, index, total, description, commands=None, destructive=False):
+    def __init__(self):
         super().__init__()
 
-        self.index = index
-        self.description = description
-        self.commands = commands or []
-        self.destructive = destructive
+        # Icon prefix
+        self.icon = Gtk.Image()
+        self.add_prefix(self.icon)
+        self.set_subtitle_selectable(True)
+
+        # preview-safe / preview-destructive, styled in the application CSS
+        self._style_class = None
 
-        # Set title with number
-        self.set_title(_("[{0}/{1}] {2}").format(index, total, description))
+    @staticmethod
+    def format(index, total, op):
+        """Return (title, subtitle, icon_name, destructive) for an operation dict"""
+        commands = op.get('commands') or []
+        destructive = bool(op.get('destructive', False))
 
-        # Icon prefix
-        icon_name = "dialog-warning-symbolic" if destructive else "emblem-ok-symbolic"
-        icon = Gtk.Image.new_from_icon_name(icon_name)
-        if destructive:
-            icon.add_css_class("error")
-        else:
-            icon.add_css_class("success")
-        self.add_prefix(icon)
+        # Title with number
+        title = _TITLE_FORMAT.format(index, total, op.get('description', ''))
 
         # If has commands, show as subtitle
+        subtitle = ""
         if commands:
-            cmd_text = "\n".join(f"$ {cmd}" for cmd in commands[:3])  # Show first 3
+            subtitle = "\n".join([f"$ {cmd}" for cmd in commands[:3]])  # Show first 3
             if len(commands) > 3:
-                cmd_text += f"\n... (+{len(commands) - 3} more)"
-            self.set_subtitle(cmd_text)
-            self.set_subtitle_selectable(True)
+                subtitle += f"\n... (+{len(commands) - 3} more)"
 
-        # Add destructive styling if needed
-        if destructive:
-            self.add_css_class("error")
+        icon_name = "dialog-warning-symbolic" if destructive else "emblem-ok-symbolic"
+        return title, subtitle, icon_name, destructive
+
+    def bind_item(self, item):
+        """Show the operation held by item"""
+        self.set_title(item.title)
+        self.set_subtitle(item.subtitle)
+        self.icon.set_from_icon_name(item.icon_name)
+
+        # Recycled rows often keep their style; only swap it when it differs
+        style_class = "preview-destructive" if item.destructive else "preview-safe"
+        if style_class != self._style_class:
+            if self._style_class:
+                self.remove_css_class(self._style_class)
+            self.add_css_class(style_class)
+            self._style_class = style_class
 
 
 class PreviewDialog(Adw.MessageDialog):
@@ -58,6 +105,10 @@ class PreviewDialog(Adw.MessageDialog):
         'preview-rejected': (GObject.SignalFlags.RUN_FIRST, None, ()),
     }
 
+    # Above this many operations a single text view replaces the row list;
+    # nobody reviews hundreds of rows one by one
+    _PLAIN_TEXT_THRESHOLD = 200
+
     def __init__(self, parent, operations, dry_run=False):
         super().__init__(
             transient_for=parent,
@@ -67,9 +118,9 @@ class PreviewDialog(Adw.MessageDialog):
         self.operations = operations
         self.dry_run = dry_run
 
-        # Count destructive operations
-        self.destructive_count = sum(1 for op in operations if op.get('destructive', False))
-        self.safe_count = len(operations) - self.destructive_count
+        # Counted while the rows are formatted in create_ui()
+        self.destructive_count = 0
+        self.safe_count = 0
 
         # Set title and message
         if dry_run:
@@ -97,52 +148,25 @@ class PreviewDialog(Adw.MessageDialog):
         scrolled.set_max_content_height(400)
         scrolled.set_propagate_natural_height(True)
 
-        # List box for operations
-        operations_list = Gtk.ListBox()
-        operations_list.set_selection_mode(Gtk.SelectionMode.NONE)
-        operations_list.add_css_class("boxed-list")
-
-        # Add operation rows
         total = len(self.operations)
+        formatted = []
+        destructive_count = 0
         for i, op in enumerate(self.operations, 1):
-            row = PreviewOperationRow(
-                index=i,
-                total=total,
-                description=op.get('description', ''),
-                commands=op.get('commands', []),
-                destructive=op.get('destructive', False)
-            )
-            operations_list.append(row)
-
-        scrolled.set_child(operations_list)
+            row = PreviewOperationRow.format(i, total, op)
+            destructive_count += row[3]
+            formatted.append(row)
+        self.destructive_count = destructive_count
+        self.safe_count = total - destructive_count
+
+        if total > self._PLAIN_TEXT_THRESHOLD:
+            scrolled.set_child(self._create_operations_text(formatted))
+        else:
+            scrolled.set_child(self._create_operations_list(formatted))
         operations_box.append(scrolled)
 
-        # Summary label
-        summary_box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=6)
-        summary_box.set_halign(Gtk.Align.CENTER)
-        summary_box.set_margin_top(6)
-
-        # Safe operations label
-        if self.safe_count > 0:
-            safe_label = Gtk.Label()
-            safe_label.set_markup(
-                f'<span color="green">✓ {self.safe_count} safe operations</span>'
-            )
-            summary_box.append(safe_label)
-
-        # Destructive operations label
-        if self.destructive_count > 0:
-            destructive_label = Gtk.Label()
-            destructive_label.set_markup(
-                f'<span color="red">⚠ {self.destructive_count} destructive operations</span>'
-            )
-            summary_box.append(destructive_label)
-
-        operations_box.append(summary_box)
-
-        # Note: Adw.MessageDialog doesn't directly support adding widgets
-        # We'll use the extra_child property if available, or modify approach
-        # For now, we'll add the content in a different way
+        # Summary label (nothing to summarize for an empty preview)
+        if total:
+            operations_box.append(self._create_summary_box())
 
         # Set button labels and responses
         if self.dry_run:
@@ -164,16 +188,68 @@ class PreviewDialog(Adw.MessageDialog):
         # Connect response signal
         self.connect("response", self.on_response)
 
-        # Try to set extra child (if supported in this GTK version)
-        try:
-            self.set_extra_child(operations_box)
-        except AttributeError:
-            # Fallback: just show operations in body text
-            ops_text = "\n".join(
-                f"[{i}/{total}] {op.get('description', '')}"
-                for i, op in enumerate(self.operations, 1)
+        # Operations below the body, or as plain titles on older libadwaita
+        _attach_extra(
+            self, operations_box,
+            lambda: "\n".join([row[0] for row in formatted])
+        )
+
+    def _create_summary_box(self):
+        """Safe/destructive operation counts"""
+        summary_box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=6)
+        summary_box.set_halign(Gtk.Align.CENTER)
+        summary_box.set_margin_top(6)
+
+        # Safe operations label
+        if self.safe_count > 0:
+            summary_box.append(Gtk.Label(label=_SAFE_MARKUP.format(self.safe_count), use_markup=True))
+
+        # Destructive operations label
+        if self.destructive_count > 0:
+            summary_box.append(
+                Gtk.Label(label=_DESTRUCTIVE_MARKUP.format(self.destructive_count), use_markup=True)
             )
-            self.set_body(self.get_body() + "\n\n" + ops_text)
+        return summary_box
+
+    def _create_operations_list(self, formatted):
+        """List view of the formatted operations"""
+        # Operation model - rows are only created for the visible part of
+        # the list and recycled while scrolling
+        model = Gio.ListStore.new(PreviewOperationItem)
+        model.splice(0, 0, [PreviewOperationItem(*row) for row in formatted])
+
+        factory = Gtk.SignalListItemFactory()
+        factory.connect('setup', self._on_row_setup)
+        factory.connect('bind', self._on_row_bind)
+
+        operations_list = Gtk.ListView.new(Gtk.NoSelection.new(model), factory)
+        operations_list.set_show_separators(True)
+        operations_list.add_css_class("card")
+        return operations_list
+
+    def _create_operations_text(self, formatted):
+        """Read-only text view of the formatted operations, for very long lists"""
+        lines = []
+        for title, subtitle, _icon_name, destructive in formatted:
+            lines.append(("⚠ " if destructive else "✓ ") + title)
+            if subtitle:
+                lines.append("    " + subtitle.replace("\n", "\n    "))
+
+        text_view = Gtk.TextView()
+        text_view.set_editable(False)
+        text_view.set_cursor_visible(False)
+        text_view.set_monospace(True)
+        text_view.set_wrap_mode(Gtk.WrapMode.WORD_CHAR)
+        text_view.add_css_class("card")
+        text_view.get_buffer().set_text("\n".join(lines))
+        return text_view
+
+    def _on_row_setup(self, factory, list_item):
+        """Create one reusable row widget for a list slot"""
+        list_item.set_child(PreviewOperationRow())
+
+    def _on_row_bind(self, factory, list_item):
+        list_item.get_child().bind_item(list_item.get_item())
 
     def on_response(self, dialog, response_id):
         """Handle dialog response"""
@@ -209,12 +285,7 @@ class SimplePreviewDialog(Adw.MessageDialog):
             details_label.add_css_class("monospace")
             details_label.add_css_class("dim-label")
             details_label.set_margin_top(12)
-
-            try:
-                self.set_extra_child(details_label)
-            except AttributeError:
-                # Fallback
-                self.set_body(message + "\n\n" + details)
+            _attach_extra(self, details_label, lambda: details)
 
         # Buttons
         self.add_response("cancel", _("Cancel"))
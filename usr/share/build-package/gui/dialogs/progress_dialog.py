@@ -9,10 +9,23 @@ import gi
 gi.require_version("Gtk", "4.0")
 gi.require_version("Adw", "1")
 
+import itertools
+import operator
 import threading
+from collections import deque
 
 from core.translation_utils import _
-from gi.repository import Adw, GLib, GObject, Gtk
+from gi.repository import Adw, Gio, GLib, GObject, Gtk
+
+# Pulse cadence for indeterminate progress bars. GTK animates the bar
+# smoothly between pulses, so a faster tick only costs main loop wakeups.
+_PULSE_INTERVAL_MS = 500
+
+# Worker-thread progress/status/log updates are applied at most this often
+_FLUSH_INTERVAL_MS = 150
+
+# Older terminal log lines are dropped beyond this, bounding memory and redraws
+_MAX_LOG_LINES = 2000
 
 
 class ProgressDialog(Adw.Window):
@@ -42,8 +55,20 @@ class ProgressDialog(Adw.Window):
         self.operation_kwargs = {}
         self.result = None
         self.error = None
-        self.cancelled = False
-        self._pulse_timeout_id = None
+        # Cancelled with the dialog; the worker checks it so a cancelled
+        # operation's outcome is not reported to a dialog that is gone
+        self.cancellable_token = Gio.Cancellable()
+        self._pulse_timeout_id = None  # Only set while mapped and pulsing
+        self._pulse_wanted = False  # Indeterminate mode requested
+        self._tags_initialized = False
+        
+        # Updates queued by worker threads until the next _flush_pending()
+        self._pending_lock = threading.Lock()
+        self._pending_lines = deque()  # (text, style)
+        self._pending_status = None
+        self._pending_progress = None  # (fraction, text)
+        self._pending_completion = None  # (success, result), posted once
+        self._flush_timeout_id = None
         
         self.create_ui()
     
@@ -61,11 +86,10 @@ class ProgressDialog(Adw.Window):
         toolbar_view.add_top_bar(header_bar)
         
         # Content box
-        content_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=12)
-        content_box.set_margin_top(24)
-        content_box.set_margin_bottom(24)
-        content_box.set_margin_start(24)
-        content_box.set_margin_end(24)
+        content_box = Gtk.Box(
+            orientation=Gtk.Orientation.VERTICAL, spacing=12,
+            margin_top=24, margin_bottom=24, margin_start=24, margin_end=24,
+        )
         toolbar_view.set_content(content_box)
         
         # Title label
@@ -131,9 +155,16 @@ class ProgressDialog(Adw.Window):
         scrolled.set_policy(Gtk.PolicyType.AUTOMATIC, Gtk.PolicyType.AUTOMATIC)
         scrolled.set_min_content_height(150)
         scrolled.set_max_content_height(250)
+        self._log_vadjustment = scrolled.get_vadjustment()
         
         # Details text view (terminal style)
         self.details_buffer = Gtk.TextBuffer()
+        # Read-only log: don't keep an undo history of every inserted line
+        self.details_buffer.set_enable_undo(False)
+        # Right-gravity mark that stays at the end, for auto-scrolling
+        self._end_mark = self.details_buffer.create_mark(
+            None, self.details_buffer.get_end_iter(), False
+        )
         self.details_view = Gtk.TextView()
         self.details_view.set_buffer(self.details_buffer)
         self.details_view.set_editable(False)
@@ -163,50 +194,139 @@ class ProgressDialog(Adw.Window):
             
             content_box.append(button_box)
         
+        # The pulse timer only runs while the dialog is on screen
+        self.connect("map", self._on_map)
+        self.connect("unmap", self._on_unmap)
+        
         # Start with indeterminate progress
         self.set_progress_mode(indeterminate=True)
     
     def set_progress_mode(self, indeterminate=False):
         """Set progress bar mode"""
+        self._pulse_wanted = indeterminate
         if indeterminate:
             self.spinner.start()
             self.progress_bar.pulse()
-            # Keep pulsing with a timer
-            self._pulse_timeout_id = GLib.timeout_add(100, self._pulse_progress)
+            if self.get_mapped():
+                self._start_pulse()
         else:
             self.spinner.stop()
-            if self._pulse_timeout_id:
-                GLib.source_remove(self._pulse_timeout_id)
-                self._pulse_timeout_id = None
+            self._stop_pulse()
             self.progress_bar.set_fraction(0.0)
     
+    def _on_map(self, widget):
+        if self._pulse_wanted:
+            self._start_pulse()
+    
+    def _on_unmap(self, widget):
+        self._stop_pulse()
+    
+    def _start_pulse(self):
+        if self._pulse_timeout_id is None:
+            self._pulse_timeout_id = GLib.timeout_add(_PULSE_INTERVAL_MS, self._pulse_progress)
+    
+    def _stop_pulse(self):
+        if self._pulse_timeout_id:
+            GLib.source_remove(self._pulse_timeout_id)
+            self._pulse_timeout_id = None
+    
     def _pulse_progress(self):
         """Pulse progress bar for indeterminate progress"""
-        if self.get_visible() and not self.cancelled:
-            self.progress_bar.pulse()
-            return True  # Continue timer
-        return False  # Stop timer
+        self.progress_bar.pulse()
+        return True  # Continue timer; stopped on unmap or mode change
     
     def set_progress(self, fraction, text=None):
         """Set progress bar value (thread-safe)"""
-        def update():
-            if self._pulse_timeout_id:
-                GLib.source_remove(self._pulse_timeout_id)
-                self._pulse_timeout_id = None
+        with self._pending_lock:
+            self._pending_progress = (fraction, text)
+            self._schedule_flush()
+    
+    def set_status(self, text):
+        """Set status text (thread-safe)"""
+        with self._pending_lock:
+            self._pending_status = text
+            self._schedule_flush()
+    
+    def _schedule_flush(self):
+        """Arrange for queued updates to be applied (caller holds _pending_lock)"""
+        if self._flush_timeout_id is None:
+            self._flush_timeout_id = GLib.timeout_add(_FLUSH_INTERVAL_MS, self._on_flush_timeout)
+    
+    def _on_flush_timeout(self):
+        with self._pending_lock:
+            self._flush_timeout_id = None
+        self._flush_pending()
+        return False  # Rescheduled by the next update
+    
+    def _post_completion(self, success, result):
+        """Queue the operation outcome behind its last updates (worker thread)"""
+        with self._pending_lock:
+            self._pending_completion = (success, result)
+            # Nothing more will follow, so flush right away at default
+            # priority instead of waiting out the batching interval
+            if self._flush_timeout_id is not None:
+                GLib.source_remove(self._flush_timeout_id)
+            self._flush_timeout_id = GLib.idle_add(
+                self._on_flush_timeout, priority=GLib.PRIORITY_DEFAULT
+            )
+    
+    def _flush_pending(self):
+        """Apply all queued updates at once: only the latest progress and
+        status matter, log lines are inserted with one scroll, and the
+        completion, if posted, comes last"""
+        with self._pending_lock:
+            lines = list(self._pending_lines)
+            self._pending_lines.clear()
+            status, self._pending_status = self._pending_status, None
+            progress, self._pending_progress = self._pending_progress, None
+            completion, self._pending_completion = self._pending_completion, None
+        
+        if progress is not None:
+            fraction, text = progress
+            self._pulse_wanted = False
+            self._stop_pulse()
             self.spinner.stop()
             self.progress_bar.set_fraction(min(1.0, max(0.0, fraction)))
             if text:
                 self.progress_bar.set_text(text)
-            return False
         
-        GLib.idle_add(update)
-    
-    def set_status(self, text):
-        """Set status text (thread-safe)"""
-        def update():
-            self.status_label.set_text(text)
-            return False
-        GLib.idle_add(update)
+        if status is not None:
+            self.status_label.set_text(status)
+        
+        if lines:
+            # Initialize tags if needed
+            if not self._tags_initialized:
+                self._setup_text_tags()
+            tag_table = self.details_buffer.get_tag_table()
+            
+            # Follow the output only if the user hasn't scrolled up to read;
+            # checked before inserting, while upper still matches the view
+            vadj = self._log_vadjustment
+            at_bottom = vadj.get_value() + vadj.get_page_size() >= vadj.get_upper() - 32
+            
+            # One insert per run of lines sharing a style; the iter is
+            # revalidated by each insert to point after the new text
+            end_iter = self.details_buffer.get_end_iter()
+            for style, run in itertools.groupby(lines, key=operator.itemgetter(1)):
+                text = "".join([line_text + "\n" for line_text, _style in run])
+                if style and tag_table.lookup(style):
+                    self.details_buffer.insert_with_tags_by_name(end_iter, text, style)
+                else:
+                    self.details_buffer.insert(end_iter, text)
+            
+            # The line count is kept by the buffer's btree, so this is cheap
+            excess = self.details_buffer.get_line_count() - _MAX_LOG_LINES
+            if excess > 0:
+                _found, cut_iter = self.details_buffer.get_iter_at_line(excess)
+                self.details_buffer.delete(self.details_buffer.get_start_iter(), cut_iter)
+            
+            if at_bottom:
+                self.details_view.scroll_mark_onscreen(self._end_mark)
+        
+        # Last, so the final log lines are in place (e.g. for the GitHub URL)
+        # and no stale status overwrites the completion message
+        if completion is not None:
+            self._complete_operation(*completion)
     
     def _setup_text_tags(self):
         """Setup color tags for terminal log"""
@@ -239,30 +359,9 @@ class ProgressDialog(Adw.Window):
     
     def append_detail(self, text, style=None):
         """Append text to details with optional color (thread-safe)"""
-        def update():
-            # Initialize tags if needed
-            if not hasattr(self, '_tags_initialized') or not self._tags_initialized:
-                self._setup_text_tags()
-            
-            end_iter = self.details_buffer.get_end_iter()
-            
-            if style and self.details_buffer.get_tag_table().lookup(style):
-                # Insert with tag
-                start_mark = self.details_buffer.create_mark(None, end_iter, True)
-                self.details_buffer.insert(end_iter, text + "\n")
-                start_iter = self.details_buffer.get_iter_at_mark(start_mark)
-                end_iter = self.details_buffer.get_end_iter()
-                self.details_buffer.apply_tag_by_name(style, start_iter, end_iter)
-                self.details_buffer.delete_mark(start_mark)
-            else:
-                self.details_buffer.insert(end_iter, text + "\n")
-            
-            # Auto-scroll to bottom
-            end_iter = self.details_buffer.get_end_iter()
-            self.details_view.scroll_to_iter(end_iter, 0.0, False, 0.0, 1.0)
-            return False
-        
-        GLib.idle_add(update)
+        with self._pending_lock:
+            self._pending_lines.append((text, style))
+            self._schedule_flush()
     
     def run_operation(self, operation_func, *args, **kwargs):
         """Run operation in background thread"""
@@ -270,9 +369,12 @@ class ProgressDialog(Adw.Window):
         self.operation_args = args
         self.operation_kwargs = kwargs
         
-        # Start operation thread
+        # Start operation thread. A daemon thread rather than a shared
+        # executor pool: pool workers are joined at interpreter exit, so
+        # quitting during a long build would hang until it finished.
         self.operation_thread = threading.Thread(
             target=self._operation_worker,
+            name="progress-op",
             daemon=True
         )
         self.operation_thread.start()
@@ -286,6 +388,10 @@ class ProgressDialog(Adw.Window):
             result = self.operation_function(*self.operation_args, **self.operation_kwargs)
             self.result = result
             
+            # The dialog is already gone; nothing left to report
+            if self.cancellable_token.is_cancelled():
+                return
+            
             # Check for failure conditions:
             # 1. Explicit False
             # 2. Empty dict {} (many operations return {} on failure)
@@ -299,24 +405,25 @@ class ProgressDialog(Adw.Window):
                 operation_failed = True
             
             if operation_failed:
-                GLib.idle_add(lambda: self._complete_operation(False, _("Operation failed - check terminal log for details")))
+                self._post_completion(False, _("Operation failed - check terminal log for details"))
             else:
-                # Signal completion on main thread (capture result by default arg)
-                GLib.idle_add(lambda r=result: self._complete_operation(True, r))
+                # Signal completion on main thread
+                self._post_completion(True, result)
             
         except Exception as ex:
             self.error = ex
+            if self.cancellable_token.is_cancelled():
+                return  # The dialog is already gone; nothing left to report
             error_msg = str(ex)
             
-            # Signal completion with error on main thread (capture by default arg)
-            GLib.idle_add(lambda err=error_msg: self._complete_operation(False, err))
+            # Signal completion with error on main thread
+            self._post_completion(False, error_msg)
     
     def _complete_operation(self, success, result):
         """Complete operation on main thread"""
         # Stop progress animation
-        if self._pulse_timeout_id:
-            GLib.source_remove(self._pulse_timeout_id)
-            self._pulse_timeout_id = None
+        self._pulse_wanted = False
+        self._stop_pulse()
         self.spinner.stop()
         self.spinner.set_visible(False)
         
@@ -437,7 +544,7 @@ class ProgressDialog(Adw.Window):
     
     def on_cancel_clicked(self, button):
         """Handle cancel button click"""
-        self.cancelled = True
+        self.cancellable_token.cancel()
         self.emit('operation-cancelled')
         self.close()
 
@@ -454,32 +561,13 @@ class SimpleProgressDialog(Adw.MessageDialog):
         self.set_heading(title)
         self.set_body(message)
         
-        # Simple progress bar
-        self.progress_bar = Gtk.ProgressBar()
-        self.progress_bar.set_margin_top(12)
-        self.progress_bar.set_margin_bottom(12)
-        self.progress_bar.set_margin_start(12)
-        self.progress_bar.set_margin_end(12)
-        
-        self._pulse_timeout_id = None
-        
-        # Start pulsing
-        self.progress_bar.pulse()
-        self._pulse_timeout_id = GLib.timeout_add(100, self._pulse_progress)
-    
-    def _pulse_progress(self):
-        """Pulse progress bar"""
-        if self.get_visible():
-            self.progress_bar.pulse()
-            return True
-        return False
-    
-    def close(self):
-        """Override close to cleanup timer"""
-        if self._pulse_timeout_id:
-            GLib.source_remove(self._pulse_timeout_id)
-            self._pulse_timeout_id = None
-        super().close()
+        # Indeterminate activity: GTK animates the spinner on the frame
+        # clock, so no Python timer is needed
+        self.spinner = Gtk.Spinner(
+            spinning=True, width_request=32, height_request=32,
+            margin_top=12, margin_bottom=12,
+        )
+        self.set_extra_child(self.spinner)
 
 
 class OperationRunner:
@@ -500,7 +588,15 @@ class OperationRunner:
         if hasattr(self.parent, 'build_package') and hasattr(self.parent.build_package, 'logger'):
             self.parent.build_package.logger.set_progress_dialog(dialog)
         
+        def disconnect_handlers(dialog):
+            # One-shot: drop both handlers so the dialog holds no closures
+            for handler_id in handler_ids:
+                dialog.disconnect(handler_id)
+            handler_ids.clear()
+        
         def on_completed(dialog, success, result):
+            disconnect_handlers(dialog)
+            
             # Disconnect logger
             if hasattr(self.parent, 'build_package') and hasattr(self.parent.build_package, 'logger'):
                 self.parent.build_package.logger.clear_progress_dialog()
@@ -510,6 +606,8 @@ class OperationRunner:
             GLib.timeout_add(800, lambda: self._finish_operation(dialog, success, result))
         
         def on_cancelled(dialog):
+            disconnect_handlers(dialog)
+            
             # Disconnect logger
             if hasattr(self.parent, 'build_package') and hasattr(self.parent.build_package, 'logger'):
                 self.parent.build_package.logger.clear_progress_dialog()
@@ -518,16 +616,22 @@ class OperationRunner:
             dialog.close()
             self._on_operation_cancelled()
         
-        dialog.connect('operation-completed', on_completed)
-        dialog.connect('operation-cancelled', on_cancelled)
+        # The handlers get the dialog as their signal argument, so the
+        # closures only reference the runner
+        handler_ids = [
+            dialog.connect('operation-completed', on_completed),
+            dialog.connect('operation-cancelled', on_cancelled),
+        ]
         
         # Setup progress callbacks if operation supports them
-        if hasattr(operation_func, '__self__'):  # Bound method
-            obj = operation_func.__self__
-            if hasattr(obj, 'set_progress_callback'):
-                obj.set_progress_callback(dialog.set_progress)
-            if hasattr(obj, 'set_status_callback'):
-                obj.set_status_callback(dialog.set_status)
+        obj = getattr(operation_func, '__self__', None)  # Bound method
+        if obj is not None:
+            set_progress_callback = getattr(obj, 'set_progress_callback', None)
+            if set_progress_callback is not None:
+                set_progress_callback(dialog.set_progress)
+            set_status_callback = getattr(obj, 'set_status_callback', None)
+            if set_status_callback is not None:
+                set_status_callback(dialog.set_status)
         
         dialog.run_operation(operation_func, *args, **kwargs)
         
@@ -4,147 +4,153 @@
 # gui/dialogs/welcome_dialog.py - Welcome dialog for first-time users
 #
 
+import functools
+import os
+
 import gi
 gi.require_version('Gtk', '4.0')
 gi.require_version('Adw', '1')
 
-from gi.repository import Gtk, Adw, GObject
+from gi.repository import Gtk, Adw, Gio, GObject
 from core.translation_utils import _
 from core.config import APP_NAME, APP_VERSION, APP_DESC
 
+_UI_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Translated once at import instead of on every dialog construction
+_WELCOME_TITLE = _("Welcome to {0}").format(APP_NAME)
+_VERSION_TEXT = _("Version {0}").format(APP_VERSION)
+
+# (icon_name, title, description)
+_FEATURES = (
+    ("document-save-symbolic", _("Commit and Push"),
+     _("Stage changes and push to your development branch with semantic commit messages")),
+    ("package-x-generic-symbolic", _("Build Packages"),
+     _("Build and deploy packages to testing, stable, or extra repositories")),
+    ("system-software-install-symbolic", _("AUR Packages"),
+     _("Build packages directly from the Arch User Repository")),
+    ("media-playlist-consecutive-symbolic", _("Branch Management"),
+     _("Manage branches, create merge requests, and cleanup old branches")),
+    ("preferences-system-symbolic", _("Advanced Operations"),
+     _("Cleanup GitHub Actions, tags, and revert commits")),
+)
+
+_TIPS = (
+    _("Use the sidebar to navigate between different operations"),
+    _("The Overview page shows your current repository status"),
+    _("Configure your preferences in Settings (Ctrl+,)"),
+    _("Press Ctrl+Q to quit the application"),
+)
+
+
+@functools.lru_cache(maxsize=None)
+def _themed_icon(icon_name):
+    """Shared Gio.ThemedIcon per name, reused by every feature row"""
+    return Gio.ThemedIcon.new(icon_name)
+
+
+class WelcomeFeatureItem(GObject.Object):
+    """Model item for one entry of the feature list"""
+
+    __gtype_name__ = 'WelcomeFeatureItem'
+
+    icon_name = GObject.Property(type=str, default="")
+    title = GObject.Property(type=str, default="")
+    description = GObject.Property(type=str, default="")
+
+    def __init__(self, icon_name, title, description):
+        super().__init__(icon_name=icon_name, title=title, description=description)
+
+
+class WelcomeFeatureRow(Gtk.Box):
+    """Row for one feature: icon, title, and description"""
+    
+    __gtype_name__ = 'WelcomeFeatureRow'
+    
+    def __init__(self):
+        super().__init__(
+            orientation=Gtk.Orientation.HORIZONTAL, spacing=12,
+            margin_start=8, margin_end=8, margin_bottom=16,
+        )
+        
+        # Icon
+        self.icon = Gtk.Image()
+        self.icon.set_pixel_size(32)
+        self.icon.add_css_class("accent")
+        self.icon.set_valign(Gtk.Align.CENTER)
+        self.append(self.icon)
+        
+        # Text box
+        text_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=2)
+        text_box.set_hexpand(True)
+        
+        self.title_label = Gtk.Label()
+        self.title_label.add_css_class("heading")
+        self.title_label.set_xalign(0)
+        text_box.append(self.title_label)
+        
+        self.desc_label = Gtk.Label()
+        self.desc_label.add_css_class("dim-label")
+        self.desc_label.set_wrap(True)
+        self.desc_label.set_xalign(0)
+        text_box.append(self.desc_label)
+        
+        self.append(text_box)
+    
+    def bind_item(self, item):
+        """Show a WelcomeFeatureItem in this (possibly recycled) row"""
+        self.icon.set_from_gicon(_themed_icon(item.icon_name))
+        self.title_label.set_text(item.title)
+        self.desc_label.set_text(item.description)
+
 
+@Gtk.Template(filename=os.path.join(_UI_DIR, 'welcome_dialog.ui'))
 class WelcomeDialog(Adw.Window):
-    """Welcome dialog shown on first run or when user requests"""
+    """Welcome dialog shown on first run or when user requests
+    
+    The static layout lives in welcome_dialog.ui; only the texts that
+    depend on the app config and the feature/tip entries are set here.
+    """
+    
+    __gtype_name__ = 'WelcomeDialog'
     
     __gsignals__ = {
         'closed': (GObject.SignalFlags.RUN_FIRST, None, (bool,)),  # show_again
     }
     
+    title_label = Gtk.Template.Child()
+    version_label = Gtk.Template.Child()
+    desc_label = Gtk.Template.Child()
+    features_list = Gtk.Template.Child()
+    tips_box = Gtk.Template.Child()
+    dont_show_check = Gtk.Template.Child()
+    start_button = Gtk.Template.Child()
+    
     def __init__(self, parent, settings):
-        super().__init__(
-            transient_for=parent,
-            modal=True
-        )
+        super().__init__(transient_for=parent)
         
         self.settings = settings
         
-        self.set_title(_("Welcome"))
-        self.set_default_size(600, 500)
-        self.set_resizable(False)
-        
         self.create_ui()
     
     def create_ui(self):
-        """Create the welcome dialog UI"""
+        """Fill in the dynamic parts of the welcome dialog"""
+        self.title_label.set_text(_WELCOME_TITLE)
+        self.version_label.set_text(_VERSION_TEXT)
+        self.desc_label.set_text(APP_DESC)
         
-        # Main container
-        main_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL)
-        self.set_content(main_box)
+        # Rows are created by the factory and filled in when bound
+        features_model = Gio.ListStore.new(WelcomeFeatureItem)
+        features_model.splice(0, 0, [WelcomeFeatureItem(*feature) for feature in _FEATURES])
         
-        # Header bar (minimal)
-        header_bar = Adw.HeaderBar()
-        header_bar.set_show_end_title_buttons(True)
-        header_bar.set_show_start_title_buttons(False)
-        main_box.append(header_bar)
+        factory = Gtk.SignalListItemFactory()
+        factory.connect('setup', self._on_feature_setup)
+        factory.connect('bind', self._on_feature_bind)
         
-        # Content with scroll
-        scrolled = Gtk.ScrolledWindow()
-        scrolled.set_policy(Gtk.PolicyType.NEVER, Gtk.PolicyType.AUTOMATIC)
-        scrolled.set_vexpand(True)
-        main_box.append(scrolled)
+        self.features_list.set_model(Gtk.NoSelection.new(features_model))
+        self.features_list.set_factory(factory)
         
-        # Content box
-        content_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=24)
-        content_box.set_margin_top(32)
-        content_box.set_margin_bottom(32)
-        content_box.set_margin_start(48)
-        content_box.set_margin_end(48)
-        content_box.set_halign(Gtk.Align.CENTER)
-        content_box.set_valign(Gtk.Align.START)
-        scrolled.set_child(content_box)
-        
-        # App icon/logo
-        icon_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=8)
-        icon_box.set_halign(Gtk.Align.CENTER)
-        
-        app_icon = Gtk.Image.new_from_icon_name("package-x-generic-symbolic")
-        app_icon.set_pixel_size(80)
-        app_icon.add_css_class("accent")
-        icon_box.append(app_icon)
-        
-        content_box.append(icon_box)
-        
-        # Welcome title
-        title_label = Gtk.Label()
-        title_label.set_text(_("Welcome to {0}").format(APP_NAME))
-        title_label.add_css_class("title-1")
-        title_label.set_halign(Gtk.Align.CENTER)
-        content_box.append(title_label)
-        
-        # Version
-        version_label = Gtk.Label()
-        version_label.set_text(_("Version {0}").format(APP_VERSION))
-        version_label.add_css_class("dim-label")
-        version_label.set_halign(Gtk.Align.CENTER)
-        content_box.append(version_label)
-        
-        # Description
-        desc_label = Gtk.Label()
-        desc_label.set_text(APP_DESC)
-        desc_label.add_css_class("body")
-        desc_label.set_wrap(True)
-        desc_label.set_justify(Gtk.Justification.CENTER)
-        desc_label.set_halign(Gtk.Align.CENTER)
-        desc_label.set_max_width_chars(60)
-        content_box.append(desc_label)
-        
-        # Features section
-        features_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=16)
-        features_box.set_margin_top(16)
-        
-        features_title = Gtk.Label()
-        features_title.set_text(_("Key Features"))
-        features_title.add_css_class("title-4")
-        features_title.set_halign(Gtk.Align.START)
-        features_box.append(features_title)
-        
-        features = [
-            ("document-save-symbolic", _("Commit and Push"), 
-             _("Stage changes and push to your development branch with semantic commit messages")),
-            ("package-x-generic-symbolic", _("Build Packages"), 
-             _("Build and deploy packages to testing, stable, or extra repositories")),
-            ("system-software-install-symbolic", _("AUR Packages"), 
-             _("Build packages directly from the Arch User Repository")),
-            ("media-playlist-consecutive-symbolic", _("Branch Management"), 
-             _("Manage branches, create merge requests, and cleanup old branches")),
-            ("preferences-system-symbolic", _("Advanced Operations"), 
-             _("Cleanup GitHub Actions, tags, and revert commits")),
-        ]
-        
-        for icon_name, title, description in features:
-            feature_row = self._create_feature_row(icon_name, title, description)
-            features_box.append(feature_row)
-        
-        content_box.append(features_box)
-        
-        # Tips section
-        tips_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=12)
-        tips_box.set_margin_top(16)
-        
-        tips_title = Gtk.Label()
-        tips_title.set_text(_("Quick Tips"))
-        tips_title.add_css_class("title-4")
-        tips_title.set_halign(Gtk.Align.START)
-        tips_box.append(tips_title)
-        
-        tips = [
-            _("Use the sidebar to navigate between different operations"),
-            _("The Overview page shows your current repository status"),
-            _("Configure your preferences in Settings (Ctrl+,)"),
-            _("Press Ctrl+Q to quit the application"),
-        ]
-        
-        for tip in tips:
+        for tip in _TIPS:
             tip_row = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=8)
             
             bullet = Gtk.Label()
@@ -160,76 +166,17 @@ class WelcomeDialog(Adw.Window):
             tip_label.set_hexpand(True)
             tip_row.append(tip_label)
             
-            tips_box.append(tip_row)
-        
-        content_box.append(tips_box)
-        
-        # Bottom section with checkbox and button
-        bottom_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=16)
-        bottom_box.set_margin_top(24)
-        main_box.append(bottom_box)
-        
-        # Separator
-        separator = Gtk.Separator(orientation=Gtk.Orientation.HORIZONTAL)
-        bottom_box.append(separator)
-        
-        # Actions box
-        actions_box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=12)
-        actions_box.set_margin_top(16)
-        actions_box.set_margin_bottom(16)
-        actions_box.set_margin_start(24)
-        actions_box.set_margin_end(24)
-        
-        # Don't show again checkbox
-        self.dont_show_check = Gtk.CheckButton()
-        self.dont_show_check.set_label(_("Don't show this welcome screen again"))
-        self.dont_show_check.set_hexpand(True)
-        actions_box.append(self.dont_show_check)
-        
-        # Get started button
-        start_button = Gtk.Button()
-        start_button.set_label(_("Get Started"))
-        start_button.add_css_class("suggested-action")
-        start_button.add_css_class("pill")
-        start_button.connect('clicked', self.on_start_clicked)
-        actions_box.append(start_button)
-        
-        bottom_box.append(actions_box)
+            self.tips_box.append(tip_row)
     
-    def _create_feature_row(self, icon_name, title, description):
-        """Create a feature row with icon, title, and description"""
-        row = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=12)
-        row.set_margin_start(8)
-        row.set_margin_end(8)
-        
-        # Icon
-        icon = Gtk.Image.new_from_icon_name(icon_name)
-        icon.set_pixel_size(32)
-        icon.add_css_class("accent")
-        icon.set_valign(Gtk.Align.CENTER)
-        row.append(icon)
-        
-        # Text box
-        text_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=2)
-        text_box.set_hexpand(True)
-        
-        title_label = Gtk.Label()
-        title_label.set_text(title)
-        title_label.add_css_class("heading")
-        title_label.set_xalign(0)
-        text_box.append(title_label)
-        
-        desc_label = Gtk.Label()
-        desc_label.set_text(description)
-        desc_label.add_css_class("dim-label")
-        desc_label.set_wrap(True)
-        desc_label.set_xalign(0)
-        text_box.append(desc_label)
-        
-        row.append(text_box)
-        
-        return row
+    def _on_feature_setup(self, factory, list_item):
+        """Create one reusable feature row for a list slot"""
+        list_item.set_child(WelcomeFeatureRow())
+        list_item.set_activatable(False)
+    
+    def _on_feature_bind(self, factory, list_item):
+        list_item.get_child().bind_item(list_item.get_item())
     
+    @Gtk.Template.Callback()
     def on_start_clicked(self, button):
         """Handle Get Started button click"""
         show_again = not self.dont_show_check.get_active()
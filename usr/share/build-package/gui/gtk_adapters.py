@@ -13,8 +13,24 @@ from core.translation_utils import _
 from core.conflict_resolver import ConflictResolver
 from .dialogs.conflict_dialog import ConflictDialog
 from .dialogs.preview_dialog import PreviewDialog, SimplePreviewDialog
+import re
 import threading
 
+# Branch names mentioned in a menu title, e.g. "in main, but your branch is dev-xxx"
+_BRANCH_RE = re.compile(r"(main|master|dev-\w+)", re.IGNORECASE)
+
+
+def _check_worker_thread():
+    """Raise unless called from a worker thread.
+
+    Dialog results are waited for by blocking the caller until a main-loop
+    callback sets an event; on the main thread itself that callback could
+    never be dispatched. Call this before scheduling anything, so a
+    refused call leaves no dialog behind.
+    """
+    if threading.current_thread() is threading.main_thread():
+        raise RuntimeError("GTK dialog results must be awaited from a worker thread")
+
 
 class GTKConflictResolver(ConflictResolver):
     """GTK-based conflict resolver using visual dialogs"""
@@ -38,6 +54,8 @@ class GTKConflictResolver(ConflictResolver):
 
     def _show_conflict_dialog(self, conflict_files, current_branch=None, incoming_branch=None):
         """Show the conflict resolution dialog"""
+        _check_worker_thread()
+
         # Reset state
         self._result_event.clear()
         self.dialog_result = False
@@ -52,10 +70,7 @@ class GTKConflictResolver(ConflictResolver):
                 progress_dialog = getattr(self.parent_window.operation_runner, 'current_dialog', None)
 
             if progress_dialog:
-                # Stop pulse animation before hiding to avoid GTK warnings
-                if hasattr(progress_dialog, '_pulse_timeout_id') and progress_dialog._pulse_timeout_id:
-                    GLib.source_remove(progress_dialog._pulse_timeout_id)
-                    progress_dialog._pulse_timeout_id = None
+                # Hiding unmaps the dialog, which stops its pulse timer
                 if hasattr(progress_dialog, 'spinner'):
                     progress_dialog.spinner.stop()
                 progress_dialog.set_visible(False)
@@ -130,6 +145,8 @@ class GTKMenuSystem:
         Helper to show dialog and wait for result without blocking GTK.
         setup_func should configure the dialog and return it.
         """
+        _check_worker_thread()
+
         self._result_event.clear()
         self._result = None
         
@@ -150,9 +167,7 @@ class GTKMenuSystem:
             
             # Detect branch pattern in title: "in X, but your branch is Y"
             # Common patterns: "You're in main, but your branch is dev-xxx"
-            import re
-            branch_pattern = r"(main|master|dev-\w+)"
-            matches = re.findall(branch_pattern, title, re.IGNORECASE)
+            matches = _BRANCH_RE.findall(title)
             
             if len(matches) >= 2:
                 # We have current branch and target branch
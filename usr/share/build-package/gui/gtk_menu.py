@@ -8,8 +8,8 @@ import gi
 gi.require_version('Gtk', '4.0')
 gi.require_version('Adw', '1')
 
-from gi.repository import Gtk, Adw, GLib
-from typing import Optional, Tuple, List
+from gi.repository import Gtk, Adw
+from typing import Callable, Optional, Tuple, List
 from core.translation_utils import _
 
 class GTKMenu:
@@ -20,11 +20,13 @@ class GTKMenu:
         self.current_dialog = None
         self.selected_option = None
         
-    def show_menu(self, title: str, options: List[str], default_index: int = 0, additional_content: str = None) -> Optional[Tuple[int, str]]:
+    def show_menu(self, title: str, options: List[str], default_index: int = 0, additional_content: str = None, *,
+                  on_done: Callable[[Optional[Tuple[int, str]]], None]) -> None:
         """
         Shows an interactive menu using GTK dialogs.
         
-        This method blocks until user makes a selection, similar to CLI version.
+        Returns right away; on_done receives (index, option), or None if
+        the dialog was closed, once the user responds.
         """
         self.selected_option = None
         
@@ -75,27 +77,19 @@ class GTKMenu:
                 except (IndexError, ValueError):
                     self.selected_option = None
             
+            self.current_dialog = None
             dialog.close()
+            on_done(self.selected_option)
         
         dialog.connect("response", on_response)
         self.current_dialog = dialog
-        
-        # Show dialog and wait for response
         dialog.present()
-        
-        # Run nested event loop to make this synchronous like CLI version
-        main_context = GLib.MainContext.default()
-        while self.current_dialog and not self.current_dialog.is_destroyed():
-            main_context.iteration(True)
-        
-        self.current_dialog = None
-        return self.selected_option
     
-    def confirm(self, title: str, message: str = None) -> bool:
+    def confirm(self, title: str, message: str = None, *, on_done: Callable[[bool], None]) -> None:
         """
         Shows a confirmation dialog.
         
-        Returns True if confirmed, False otherwise.
+        Returns right away; on_done receives True if confirmed, False otherwise.
         """
         dialog = Adw.MessageDialog.new(
             self.main_window,
@@ -110,28 +104,20 @@ class GTKMenu:
         dialog.set_response_appearance("confirm", Adw.ResponseAppearance.SUGGESTED)
         dialog.set_default_response("confirm")
         
-        result = False
-        
         def on_response(dialog, response_id):
-            nonlocal result
-            result = (response_id == "confirm")
             dialog.close()
+            on_done(response_id == "confirm")
         
         dialog.connect("response", on_response)
         dialog.present()
-        
-        # Wait for response
-        main_context = GLib.MainContext.default()
-        while not dialog.is_destroyed():
-            main_context.iteration(True)
-        
-        return result
     
-    def show_input_dialog(self, title: str, message: str, placeholder: str = "") -> Optional[str]:
+    def show_input_dialog(self, title: str, message: str, placeholder: str = "", *,
+                          on_done: Callable[[Optional[str]], None]) -> None:
         """
         Shows an input dialog for text entry.
         
-        Returns the entered text or None if cancelled.
+        Returns right away; on_done receives the entered text, or None if
+        cancelled or left empty.
         """
         dialog = Gtk.Dialog()
         dialog.set_transient_for(self.main_window)
@@ -166,23 +152,24 @@ class GTKMenu:
         # Focus the entry
         entry.grab_focus()
         
-        dialog.present()
-        response = dialog.run()
-        
-        result = None
-        if response == Gtk.ResponseType.OK:
-            result = entry.get_text().strip()
-            if not result:  # Empty string
-                result = None
+        def on_response(dialog, response):
+            result = None
+            if response == Gtk.ResponseType.OK:
+                result = entry.get_text().strip() or None  # Empty string
+            
+            dialog.destroy()
+            on_done(result)
         
-        dialog.destroy()
-        return result
+        dialog.connect("response", on_response)
+        dialog.present()
     
-    def show_selection_dialog(self, title: str, options: List[str], message: str = None) -> Optional[str]:
+    def show_selection_dialog(self, title: str, options: List[str], message: str = None, *,
+                              on_done: Callable[[Optional[str]], None]) -> None:
         """
         Shows a selection dialog with radio buttons.
         
-        Returns the selected option or None if cancelled.
+        Returns right away; on_done receives the selected option, or None
+        if cancelled.
         """
         dialog = Gtk.Dialog()
         dialog.set_transient_for(self.main_window)
@@ -227,18 +214,19 @@ class GTKMenu:
             radio_buttons.append(radio)
             content_area.append(radio)
         
-        dialog.present()
-        response = dialog.run()
-        
-        result = None
-        if response == Gtk.ResponseType.OK:
-            for i, radio in enumerate(radio_buttons):
-                if radio.get_active():
-                    result = options[i]
-                    break
+        def on_response(dialog, response):
+            result = None
+            if response == Gtk.ResponseType.OK:
+                for i, radio in enumerate(radio_buttons):
+                    if radio.get_active():
+                        result = options[i]
+                        break
+            
+            dialog.destroy()
+            on_done(result)
         
-        dialog.destroy()
-        return result
+        dialog.connect("response", on_response)
+        dialog.present()
     
     def show_progress_dialog(self, title: str, message: str = None):
         """
@@ -144,6 +144,16 @@ class BuildPackageApplication(Adw.Application):
             .sidebar-listbox row:selected image {
                 color: @accent_fg_color;
             }
+
+            /* ─── Operation preview rows ─── */
+            /* One class per row; the prefix icon picks up the color */
+            .preview-destructive {
+                color: @error_color;
+            }
+
+            .preview-safe image {
+                color: @success_color;
+            }
         """
         css_provider.load_from_data(css_data.encode("utf-8"))
 
@@ -197,10 +207,8 @@ class BuildPackageApplication(Adw.Application):
     def on_preferences_activated(self, action, param):
         """Show preferences dialog"""
         if self.main_window and hasattr(self.main_window, "settings"):
-            from gui.dialogs.preferences_dialog import PreferencesDialog
-
-            dialog = PreferencesDialog(self.main_window, self.main_window.settings)
-            dialog.present(self.main_window)
+            # The window keeps a single dialog instance across opens
+            self.main_window.on_preferences_activated(action, param)
         else:
             if self.main_window:
                 self.main_window.show_info_toast(_("Settings not available"))
@@ -19,7 +19,6 @@ from core.settings import Settings
 from core.translation_utils import _
 from gi.repository import Adw, Gio, GLib, Gtk
 
-from .dialogs.preferences_dialog import PreferencesDialog
 from .dialogs.progress_dialog import OperationRunner
 from .dialogs.welcome_dialog import WelcomeDialog, should_show_welcome
 from .gtk_adapters import GTKConflictResolver, GTKMenuSystem
@@ -43,6 +42,7 @@ class MainWindow(Adw.ApplicationWindow):
 
         self.application = application
         self.build_package = None
+        self._preferences_dialog = None  # Created on first open
 
         # Initialize settings first
         self.settings = Settings()
@@ -407,8 +407,14 @@ class MainWindow(Adw.ApplicationWindow):
 
     def on_preferences_activated(self, action, param):
         """Handle preferences action - show Preferences dialog"""
-        dialog = PreferencesDialog(self, self.settings)
-        dialog.present(self)  # Pass parent for modal behavior
+        # Built on first use, then reused and re-synced on later opens
+        if self._preferences_dialog is None:
+            # Imported here so startup does not load the dialog module
+            from .dialogs.preferences_dialog import PreferencesDialog
+            self._preferences_dialog = PreferencesDialog(self, self.settings)
+        else:
+            self._preferences_dialog.refresh()
+        self._preferences_dialog.present(self)  # Pass parent for modal behavior
 
     def on_about_activated(self, action, param):
         """Handle about action - show About dialog"""
@@ -762,11 +768,7 @@ class MainWindow(Adw.ApplicationWindow):
         # Try to read from file (in case it was created externally)
         token = github_api.get_github_token_optional()
         if token:
-            github_api.token = token
-            github_api.headers = {
-                "Accept": "application/vnd.github.v3+json",
-                "Authorization": f"token {token}",
-            }
+            github_api.set_token(token)
             self.operation_runner.run_with_progress(operation, title, description)
             return
 
@@ -851,11 +853,7 @@ class MainWindow(Adw.ApplicationWindow):
                     
                     # Update the API instance
                     github_api = self.build_package.github_api
-                    github_api.token = token_text
-                    github_api.headers = {
-                        "Accept": "application/vnd.github.v3+json",
-                        "Authorization": f"token {token_text}"
-                    }
+                    github_api.set_token(token_text)
 
                     self.show_toast(_("✓ Token saved successfully"))
                     dialog.close()